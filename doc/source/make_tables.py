@@ -4,13 +4,19 @@
 from __future__ import annotations
 
 from abc import abstractmethod
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import StrEnum, auto
-import inspect
-import io
+from functools import cached_property, lru_cache
+import hashlib
+from itertools import chain
+import json
+from operator import itemgetter
 import os
 from pathlib import Path
+import pickle
 import re
+import sys
 import textwrap
 from typing import (
     TYPE_CHECKING,
@@ -30,6 +36,7 @@ from typing import (
 )
 
 import numpy as np
+from PIL import Image
 
 import pyvista
 import pyvista as pv
@@ -38,12 +45,19 @@ from pyvista.examples._dataset_loader import (
     DatasetObject,
     _DatasetLoader,
     _Downloadable,
+    _DownloadableFile,
+    _MultiFileDatasetLoader,
     _MultiFilePropsProtocol,
     _SingleFilePropsProtocol,
 )
 
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
 if TYPE_CHECKING:
-    from types import FunctionType, ModuleType
+    from types import ModuleType
 
 # Paths to directories in which resulting rst files and images are stored.
 CHARTS_TABLE_DIR = "api/plotting/charts"
@@ -58,6 +72,18 @@ DATASET_GALLERY_DIR = "api/examples/dataset-gallery"
 # These images are auto-generated by the `.. pyvista_plot::` directive
 DATASET_GALLERY_IMAGE_DIR = "../_build/plot_directive/api/examples/_autosummary"
 
+# File where the generated rst of each dataset card is cached between doc builds
+DATASET_CARDS_CACHE_PATH = "../_build/dataset_card_cache.json"
+
+# File where the info collected from the loaded datasets is cached between doc builds
+DATASET_INFO_CACHE_PATH = "../_build/dataset_info_cache.pkl"
+
+# Set this environment variable to '1' to ignore the caches above and regenerate everything
+REBUILD_ENV_VAR = 'PYVISTA_DOC_REBUILD'
+
+# Number of datasets downloaded concurrently
+MAX_DOWNLOAD_WORKERS = 16
+
 # Generated docstring images are assumed to have '.png' extension
 # Define special cases for specific datasets here. Use `None` if no image is generated.
 DATASET_GALLERY_IMAGE_EXT_DICT = {
@@ -70,6 +96,16 @@ DATASET_GALLERY_IMAGE_EXT_DICT = {
     'dual_sphere_animation': '.gif',
 }
 
+# Hash of this module's source. Cached rst is invalidated if this module changes
+_MODULE_HASH = hashlib.blake2b(Path(__file__).read_bytes(), digest_size=16).hexdigest()
+
+# Pattern matching hex code memory addresses in dataset reprs
+HEX_ADDRESS_PATTERN = re.compile(r'0x[0-9a-f]*', re.ASCII)
+
+# Replacements for formatting the repr of a type (or a tuple of types) as doc references
+TYPE_REPR_MAP = {"<class '": ':class:`~', "'>": '`', '(': '', ')': '', ', ': '\n'}
+TYPE_REPR_PATTERN = re.compile('|'.join(re.escape(key) for key in TYPE_REPR_MAP))
+
 
 def _aligned_dedent(txt):
     """Custom variant of `textwrap.dedent`.
@@ -79,6 +115,131 @@ def _aligned_dedent(txt):
     return textwrap.dedent(txt).replace('|', '')
 
 
+class _PositionalTemplate(str):
+    """Template string with only positional ``{}`` replacement fields.
+
+    The template is split around its fields once when it is created so that
+    :meth:`format` only needs to join the parts with the arguments, rather than
+    parsing the template on every call.
+    """
+
+    def __new__(cls, template):
+        self = super().__new__(cls, template)
+        self._parts = template.split('{}')
+        assert template.count('{') == len(self._parts) - 1, 'Only `{}` fields are supported.'
+        self._indented: Dict[int, _IndentedTemplate] = {}
+        return self
+
+    def format(self, *args):
+        """Format the template with positional arguments."""
+        assert len(args) == len(self._parts) - 1, 'Wrong number of arguments for template.'
+        return ''.join(chain.from_iterable(zip(self._parts, map(str, args)))) + self._parts[-1]
+
+    def indent(self, indent_level):
+        """Return this template with all lines after the first indented by some amount.
+
+        Formatting the indented template is equivalent to indenting the formatted
+        text with :func:`_indent_multi_line_string`, but the template itself is
+        only indented once. The indented template is cached for each level.
+        """
+        try:
+            return self._indented[indent_level]
+        except KeyError:
+            indented = _IndentedTemplate(self, indent_level)
+            self._indented[indent_level] = indented
+            return indented
+
+
+class _IndentedTemplate(_PositionalTemplate):
+    """Positional template which indents all lines after the first when formatted.
+
+    This class should only be created with :meth:`_PositionalTemplate.indent`.
+    """
+
+    def __new__(cls, template, indent_level):
+        self = super().__new__(cls, _indent_multi_line_string(template, indent_level=indent_level))
+        self._template = template
+        self._indent_level = indent_level
+        self._newline = '\n' + ' ' * (3 * indent_level)
+        return self
+
+    def format(self, *args):
+        """Format the template with positional arguments and indent them."""
+        values = [str(arg) for arg in args]
+        parts = self._template._parts
+        pieces = [*chain.from_iterable(zip(parts, values)), parts[-1]]
+        first = next((piece for piece in pieces if piece), '')
+        last = next((piece for piece in reversed(pieces) if piece), '')
+        if not first or first[0] == '\n' or last[-1] == '\n':
+            # Empty leading and trailing lines are not handled the same way when
+            # indenting the template and arguments separately, so indent directly
+            return _indent_multi_line_string(''.join(pieces), indent_level=self._indent_level)
+        # Indent the arguments' lines to match the indentation of the template
+        return super().format(*(value.replace('\n', self._newline) for value in values))
+
+
+def _hash_file(path, chunk_size=65536):
+    """Compute the BLAKE2 digest of a file, reading it in chunks."""
+    digest = hashlib.blake2b(digest_size=16)
+    with Path(path).open('rb') as f:
+        while chunk := f.read(chunk_size):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def _hash_sources(directory) -> str:
+    """Compute the BLAKE2 hex digest of all Python sources in a directory."""
+    digest = hashlib.blake2b(digest_size=16)
+    for path in sorted(Path(directory).rglob('*.py')):
+        digest.update(path.relative_to(directory).as_posix().encode('utf-8'))
+        digest.update(_hash_file(path))
+    return digest.hexdigest()
+
+
+# Hash of the core sources. These define the dataset properties shown in the cards
+_CORE_HASH = _hash_sources(Path(pyvista.core.__file__).parent)
+
+
+def _rebuild_requested() -> bool:
+    """Return ``True`` if the cached dataset info and cards should be ignored."""
+    return os.environ.get(REBUILD_ENV_VAR) == '1'
+
+
+def _hash_image(img):
+    """Get a hash of the image data.
+
+    ``xxhash`` is used if it is installed since it is much faster than the
+    hash functions in the standard library.
+    """
+    data = np.ascontiguousarray(img).tobytes()
+    if xxhash is None:
+        return {'algorithm': 'blake2b', 'digest': hashlib.blake2b(data, digest_size=16).hexdigest()}
+    return {'algorithm': 'xxh3_64', 'digest': xxhash.xxh3_64(data).hexdigest()}
+
+
+def _save_image_if_changed(img, img_path):
+    """Save an image generated by a plotter unless it has not changed.
+
+    A hash of the image data is stored in a ``.hash.json`` file alongside the
+    saved image. The image is only saved if its hash does not match the stored
+    hash, so the existing file never needs to be read or decoded.
+    """
+    img_hash = _hash_image(img)
+    hash_path = Path(f'{img_path}.hash.json')
+    if Path(img_path).is_file():
+        # exit early if the image already exists and is the same
+        try:
+            if json.loads(hash_path.read_text()) == img_hash:
+                return
+        except (OSError, ValueError):
+            # a missing or unreadable hash file is treated as a changed image
+            pass
+
+    # save it. The images are small, so use fast rather than maximal compression
+    Image.fromarray(img).save(img_path, format='PNG', compress_level=1, optimize=False)
+    hash_path.write_text(json.dumps(img_hash))
+
+
 class DocTable:
     """Helper class to create tables for the documentation.
 
@@ -89,12 +250,18 @@ class DocTable:
     Each table is generated from a list of 'row_data' provided by the ``fetch_data``
     method. The ``get_header`` and ``get_row`` methods generate the required rst
     for the table's header and table's rows respectively.
+    Subclasses which include an image in their rows should also provide the
+    ``get_img_args`` and ``generate_img`` methods. The images of all rows are
+    generated in parallel before any row rst is generated.
     """
 
     # Path to the rst file to which the table will be written
     # Param should not be None for subclasses
     path: str = None  # type: ignore[assignment]
 
+    # Off-screen plotters used to generate the row images, keyed by window size
+    _plotter_pool: ClassVar[Dict[Tuple[int, int], pv.Plotter]] = {}
+
     @classmethod
     def generate(cls):
         """Generate this table."""
@@ -105,30 +272,48 @@ class DocTable:
         data = cls.fetch_data()
         assert data is not None, f"No data was fetched by {cls}."
 
-        with io.StringIO() as fnew:
-            fnew.write(cls.get_header(data))
-            for i, row_data in enumerate(data):
-                row = cls.get_row(i, row_data)
-                if row is not None:
-                    fnew.write(row)
-
-            # if file exists, verify that we have no new content
-            fnew.seek(0)
-            new_txt = fnew.read()
+        # Generate all row images first. Each image is rendered independently,
+        # so use a separate process for each image since rendering contexts
+        # cannot be shared between threads.
+        img_args = [
+            args
+            for i, row_data in enumerate(data)
+            if (args := cls.get_img_args(i, row_data)) is not None
+        ]
+        if img_args:
+            # Split the rows into one batch per worker so that each worker
+            # can reuse the same plotter for all of its images
+            n_workers = min(os.cpu_count() or 1, len(img_args))
+            batches = [img_args[i::n_workers] for i in range(n_workers)]
+            with ProcessPoolExecutor(max_workers=n_workers) as executor:
+                # Consume the results to re-raise any exceptions from the workers
+                list(executor.map(cls._generate_imgs, batches))
+
+        chunks = [cls.get_header(data)]
+        chunks.extend(
+            row
+            for row in (cls.get_row(i, row_data) for i, row_data in enumerate(data))
+            if row is not None
+        )
+        new_txt = ''.join(chunks)
 
-        # determine if existing file needs to be rewritten
-        if Path(cls.path).exists():
-            with Path(cls.path).open(encoding="utf-8") as fold:
-                orig_txt = fold.read()
-            if orig_txt == new_txt:
-                new_txt = ''
+        # if file exists, verify that we have no new content. The file size is
+        # checked first so that the file is only read if it may be unchanged
+        new_bytes = new_txt.encode('utf-8')
+        path = Path(cls.path)
+        try:
+            orig_size = path.stat().st_size
+        except FileNotFoundError:
+            orig_size = None
+        if orig_size == len(new_bytes):
+            if _hash_file(path) == hashlib.blake2b(new_bytes, digest_size=16).digest():
+                new_bytes = b''
 
         # write if there is any text to write. This avoids resetting the documentation cache
-        if new_txt:
-            with open(cls.path, 'w', encoding="utf-8") as fout:
-                fout.write(new_txt)
-
-        pv.close_all()
+        if new_bytes:
+            # write the already encoded text as-is so the file size matches
+            with open(cls.path, 'wb') as fout:
+                fout.write(new_bytes)
 
     @classmethod
     def fetch_data(cls):
@@ -146,6 +331,51 @@ class DocTable:
         be generated for the provided ``row_data``."""
         raise NotImplementedError("Subclasses should specify a get_row method.")
 
+    @classmethod
+    def get_img_args(cls, i, row_data):
+        """Get the arguments passed to ``generate_img`` for the given row. Can
+        return ``None`` if no image should be generated for the provided ``row_data``."""
+        # No images are generated by default
+
+    @classmethod
+    def generate_img(cls, *args):
+        """Generate and save the image of a row."""
+        raise NotImplementedError("Subclasses with images should specify a generate_img method.")
+
+    @classmethod
+    def _generate_imgs(cls, img_args):
+        """Generate the images for a batch of rows and close any plotters used."""
+        try:
+            for args in img_args:
+                cls.generate_img(*args)
+        finally:
+            cls._close_plotter_pool()
+
+    @classmethod
+    def _get_pooled_plotter(cls, window_size):
+        """Get a cleared off-screen plotter with the specified window size.
+
+        Creating a new plotter for every image is expensive, so the plotter is
+        only created the first time it is requested and is reused afterward.
+        """
+        window_size = tuple(window_size)
+        try:
+            p = cls._plotter_pool[window_size]
+        except KeyError:
+            p = pv.Plotter(off_screen=True, window_size=window_size)
+            cls._plotter_pool[window_size] = p
+        else:
+            p.clear()
+        p.background_color = 'w'
+        return p
+
+    @classmethod
+    def _close_plotter_pool(cls):
+        """Close all pooled plotters."""
+        for p in cls._plotter_pool.values():
+            p.close()
+        cls._plotter_pool.clear()
+
 
 class LineStyleTable(DocTable):
     """Class to generate line style table."""
@@ -162,12 +392,14 @@ class LineStyleTable(DocTable):
         |     - Example
         """,
     )
-    row_template = _aligned_dedent(
-        """
-        |   * - ``"{}"``
-        |     - {}
-        |     - .. image:: /{}
-        """,
+    row_template = _PositionalTemplate(
+        _aligned_dedent(
+            """
+            |   * - ``"{}"``
+            |     - {}
+            |     - .. image:: /{}
+            """,
+        ),
     )
 
     @classmethod
@@ -184,31 +416,30 @@ class LineStyleTable(DocTable):
         if row_data["descr"] is None:
             return None  # Skip line style if description is set to ``None``.
         else:
-            # Create an image from the given line style and generate the row rst.
+            # Generate the row rst using the image created from the given line style.
             img_path = f"{CHARTS_IMAGE_DIR}/ls_{i}.png"
-            cls.generate_img(row_data["style"], img_path)
             return cls.row_template.format(row_data["style"], row_data["descr"], img_path)
 
-    @staticmethod
-    def generate_img(line_style, img_path):
+    @classmethod
+    def get_img_args(cls, i, row_data):
+        if row_data["descr"] is None:
+            return None
+        return row_data["style"], f"{CHARTS_IMAGE_DIR}/ls_{i}.png"
+
+    @classmethod
+    def generate_img(cls, line_style, img_path):
         """Generate and save an image of the given line_style."""
-        p = pv.Plotter(off_screen=True, window_size=[100, 50])
-        p.background_color = 'w'
+        p = cls._get_pooled_plotter([100, 50])
         chart = pv.Chart2D()
         chart.line([0, 1], [0, 0], color="b", width=3.0, style=line_style)
         chart.hide_axes()
         p.add_chart(chart)
 
         # Generate and crop the image
-        _, img = p.show(screenshot=True, return_cpos=True)
+        _, img = p.show(screenshot=True, return_cpos=True, auto_close=False)
         img = img[18:25, 22:85, :]
 
-        # exit early if the image already exists and is the same
-        if os.path.isfile(img_path) and pv.compare_images(img, img_path) < 1:
-            return
-
-        # save it
-        p._save_image(img, img_path, False)
+        _save_image_if_changed(img, img_path)
 
 
 class MarkerStyleTable(DocTable):
@@ -226,12 +457,14 @@ class MarkerStyleTable(DocTable):
         |     - Example
         """,
     )
-    row_template = _aligned_dedent(
-        """
-        |   * - ``"{}"``
-        |     - {}
-        |     - .. image:: /{}
-        """,
+    row_template = _PositionalTemplate(
+        _aligned_dedent(
+            """
+            |   * - ``"{}"``
+            |     - {}
+            |     - .. image:: /{}
+            """,
+        ),
     )
 
     @classmethod
@@ -250,31 +483,30 @@ class MarkerStyleTable(DocTable):
         if row_data["descr"] is None:
             return None  # Skip marker style if description is set to ``None``.
         else:
-            # Create an image from the given marker style and generate the row rst.
+            # Generate the row rst using the image created from the given marker style.
             img_path = f"{CHARTS_IMAGE_DIR}/ms_{i}.png"
-            cls.generate_img(row_data["style"], img_path)
             return cls.row_template.format(row_data["style"], row_data["descr"], img_path)
 
-    @staticmethod
-    def generate_img(marker_style, img_path):
+    @classmethod
+    def get_img_args(cls, i, row_data):
+        if row_data["descr"] is None:
+            return None
+        return row_data["style"], f"{CHARTS_IMAGE_DIR}/ms_{i}.png"
+
+    @classmethod
+    def generate_img(cls, marker_style, img_path):
         """Generate and save an image of the given marker_style."""
-        p = pv.Plotter(off_screen=True, window_size=[100, 100])
-        p.background_color = 'w'
+        p = cls._get_pooled_plotter([100, 100])
         chart = pv.Chart2D()
         chart.scatter([0], [0], color="b", size=9, style=marker_style)
         chart.hide_axes()
         p.add_chart(chart)
 
         # generate and crop the image
-        _, img = p.show(screenshot=True, return_cpos=True)
+        _, img = p.show(screenshot=True, return_cpos=True, auto_close=False)
         img = img[40:53, 47:60, :]
 
-        # exit early if the image already exists and is the same
-        if Path(img_path).is_file() and pv.compare_images(img, img_path) < 1:
-            return
-
-        # save it
-        p._save_image(img, img_path, False)
+        _save_image_if_changed(img, img_path)
 
 
 class ColorSchemeTable(DocTable):
@@ -293,19 +525,29 @@ class ColorSchemeTable(DocTable):
         |     - Example
         """,
     )
-    row_template = _aligned_dedent(
-        """
-        |   * - ``"{}"``
-        |     - {}
-        |     - {}
-        |     - .. image:: /{}
-        """,
+    row_template = _PositionalTemplate(
+        _aligned_dedent(
+            """
+            |   * - ``"{}"``
+            |     - {}
+            |     - {}
+            |     - .. image:: /{}
+            """,
+        ),
     )
 
     @classmethod
     def fetch_data(cls):
         # Fetch table data from ``COLOR_SCHEMES`` dictionary.
-        return [{"scheme": cs, **data} for (cs, data) in pv.colors.COLOR_SCHEMES.items()]
+        # The number of colors is only needed for schemes with a description.
+        return [
+            {
+                "scheme": cs,
+                "n_colors": None if data["descr"] is None else cls.get_n_colors(cs),
+                **data,
+            }
+            for (cs, data) in pv.colors.COLOR_SCHEMES.items()
+        ]
 
     @classmethod
     def get_header(cls, data):
@@ -316,44 +558,44 @@ class ColorSchemeTable(DocTable):
         if row_data["descr"] is None:
             return None  # Skip color scheme if description is set to ``None``.
         else:
-            # Create an image from the given color scheme and generate the row rst.
+            # Generate the row rst using the image created from the given color scheme.
             img_path = f"{CHARTS_IMAGE_DIR}/cs_{i}.png"
-            n_colors = cls.generate_img(row_data["scheme"], img_path)
             return cls.row_template.format(
                 row_data["scheme"],
                 row_data["descr"],
-                n_colors,
+                row_data["n_colors"],
                 img_path,
             )
 
+    @classmethod
+    def get_img_args(cls, i, row_data):
+        if row_data["descr"] is None:
+            return None
+        return row_data["scheme"], row_data["n_colors"], f"{CHARTS_IMAGE_DIR}/cs_{i}.png"
+
     @staticmethod
-    def generate_img(color_scheme, img_path):
+    def get_n_colors(color_scheme):
+        """Get the total number of colors in the given color_scheme."""
+        # Use a temporary plot to determine the total number of colors in this scheme
+        tmp_plot = pv.Chart2D().bar([0], [[1]] * 2, color=color_scheme, orientation="H")
+        return len(tmp_plot.colors)
+
+    @classmethod
+    def generate_img(cls, color_scheme, n_colors, img_path):
         """Generate and save an image of the given color_scheme."""
-        p = pv.Plotter(off_screen=True, window_size=[240, 120])
-        p.background_color = 'w'
+        p = cls._get_pooled_plotter([240, 120])
         chart = pv.Chart2D()
-        # Use a temporary plot to determine the total number of colors in this scheme
-        tmp_plot = chart.bar([0], [[1]] * 2, color=color_scheme, orientation="H")
-        n_colors = len(tmp_plot.colors)
         plot = chart.bar([0], [[1]] * n_colors, color=color_scheme, orientation="H")
-        chart.remove_plot(tmp_plot)
         plot.pen.color = 'w'
         chart.x_range = [0, n_colors]
         chart.hide_axes()
         p.add_chart(chart)
 
         # Generate and crop the image
-        _, img = p.show(screenshot=True, return_cpos=True)
+        _, img = p.show(screenshot=True, return_cpos=True, auto_close=False)
         img = img[34:78, 22:225, :]
 
-        # exit early if the image already exists and is the same
-        if Path(img_path).is_file() and pv.compare_images(img, img_path) < 1:
-            return n_colors
-
-        # save it
-        p._save_image(img, img_path, False)
-
-        return n_colors
+        _save_image_if_changed(img, img_path)
 
 
 class ColorTable(DocTable):
@@ -371,26 +613,30 @@ class ColorTable(DocTable):
         |     - Example
         """,
     )
-    row_template = _aligned_dedent(
-        """
-        |   * - {}
-        |     - ``{}``
-        |     - .. raw:: html
-        |
-        |          <span style='width:100%; height:100%; display:block; background-color: {};'>&nbsp;</span>
-        """,
+    row_template = _PositionalTemplate(
+        _aligned_dedent(
+            """
+            |   * - {}
+            |     - ``{}``
+            |     - .. raw:: html
+            |
+            |          <span style='width:100%; height:100%; display:block; background-color: {};'>&nbsp;</span>
+            """,
+        ),
     )
 
     @classmethod
     def fetch_data(cls):
-        # Fetch table data from ``hexcolors`` dictionary.
-        colors = {
-            name: {"name": name, "hex": hex_, "synonyms": []} for name, hex_ in pv.hexcolors.items()
-        }
-        # Add synonyms defined in ``color_synonyms`` dictionary.
+        # Group the synonyms defined in ``color_synonyms`` dictionary by color name.
+        synonyms: Dict[str, List[str]] = {}
         for s, name in pv.colors.color_synonyms.items():
-            colors[name]["synonyms"].append(s)
-        return colors.values()
+            synonyms.setdefault(name, []).append(s)
+        # Fetch table data from ``hexcolors`` dictionary. A list is returned since
+        # the data is iterated over more than once.
+        return [
+            {"name": name, "hex": hex_, "synonyms": synonyms.get(name, [])}
+            for name, hex_ in pv.hexcolors.items()
+        ]
 
     @classmethod
     def get_header(cls, data):
@@ -404,16 +650,45 @@ class ColorTable(DocTable):
         return cls.row_template.format(name, row_data["hex"], row_data["hex"])
 
 
+@lru_cache(maxsize=None)
 def _get_doc(func: Callable[[], Any]) -> Optional[str]:
     """Return the first line of the callable's docstring."""
     return doc.splitlines()[0] if (doc := func.__doc__) else None
 
 
+@lru_cache(maxsize=None)
 def _get_fullname(typ: Type[Any]) -> str:
     """Return the fully qualified name of the given type object."""
     return f"{typ.__module__}.{typ.__qualname__}"
 
 
+def _get_dataset_repr(loader: _DatasetLoader) -> str:
+    """Return the repr of the loader's dataset with memory addresses removed."""
+    # Replace any hex code memory addresses with ellipses
+    return HEX_ADDRESS_PATTERN.sub('...', repr(loader.dataset))
+
+
+def _get_files_mtime(loader: _DatasetLoader) -> Optional[int]:
+    """Return the latest modification time in nanoseconds of the loader's local files.
+
+    ``None`` is returned if the loader has no files or if any file is missing.
+    """
+    try:
+        paths = loader.path
+    except (AttributeError, VTKVersionError):
+        return None
+    paths = [paths] if isinstance(paths, str) or paths is None else paths
+    mtimes = []
+    try:
+        for path in map(Path, paths):
+            mtimes.append(path.stat().st_mtime_ns)
+            if path.is_dir():
+                mtimes.extend(file.stat().st_mtime_ns for file in path.rglob('*'))
+    except (OSError, TypeError):
+        return None
+    return max(mtimes, default=None)
+
+
 def _ljust_lines(lines: List[str], min_width=None) -> List[str]:
     """Left-justify a list of lines."""
     min_width = min_width if min_width else _max_width(lines)
@@ -425,9 +700,9 @@ def _max_width(lines: List[str]) -> int:
     return max(map(len, lines))
 
 
-def _repeat_string(string: str, num_repeat: int) -> str:
-    """Repeat `string` `num_repeat` times."""
-    return ''.join([string] * num_repeat)
+def _pad_lines_list(lines: Iterable[str], *, pad_left: str = '', pad_right: str = '') -> List[str]:
+    """Add padding to the left or right of each line in an already split list of lines."""
+    return [pad_left + line + pad_right for line in lines]
 
 
 def _pad_lines(
@@ -469,7 +744,7 @@ def _pad_lines(
     # Justify
     lines = _ljust_lines(lines) if ljust else lines
     # Pad
-    lines = [pad_left + line + pad_right for line in lines]
+    lines = _pad_lines_list(lines, pad_left=pad_left, pad_right=pad_right)
 
     if return_shape:
         width, height = _max_width(lines), len(lines)
@@ -508,14 +783,39 @@ def _indent_multi_line_string(
     """
     lines = string.splitlines()
     if len(lines) > 0:
-        indentation = _repeat_string(' ', num_repeat=indent_size * indent_level)
-        first_line = lines.pop(0) if omit_first_line else None
-        lines = _pad_lines(lines, pad_left=indentation) if len(lines) > 0 else lines
-        lines.insert(0, first_line) if first_line else None
-        return '\n'.join(lines)
+        indentation = ' ' * (indent_size * indent_level)
+        first_line, lines = (lines[0], lines[1:]) if omit_first_line else (None, lines)
+        if not lines:
+            return first_line
+        # Indent all lines with a single join instead of padding each line separately
+        indented = indentation + f'\n{indentation}'.join(lines)
+        return f'{first_line}\n{indented}' if first_line else indented
     return string
 
 
+def _download_if_missing(loader: _Downloadable[Any]) -> None:
+    """Download the loader's file(s) unless they are all already present on disk.
+
+    The local paths are only known (and absolute) once the files have been
+    downloaded, so any relative path is treated as missing.
+    """
+    paths = loader.path
+    paths = [paths] if isinstance(paths, str) or paths is None else paths
+    if not all(
+        path is not None and Path(path).is_absolute() and Path(path).exists() for path in paths
+    ):
+        loader.download()
+
+
+def _iter_downloadable_files(loader: _DatasetLoader) -> Iterator[_DownloadableFile]:
+    """Iterate over all individual downloadable files used by a loader."""
+    if isinstance(loader, _DownloadableFile):
+        yield loader
+    elif isinstance(loader, _MultiFileDatasetLoader):
+        for file in loader._file_objects:
+            yield from _iter_downloadable_files(file)
+
+
 def _as_iterable(item) -> Iterable[Any]:
     return [item] if not isinstance(item, (Iterable, str)) else item
 
@@ -550,53 +850,55 @@ class DatasetCard:
     details on the directives used and their formatting.
     """
 
-    card_template = _aligned_dedent(
-        """
-        |.. card::
-        |
-        |   {}
-        |
-        |   ^^^
-        |
-        |   .. grid:: 1 2 2 2
-        |      :margin: 1
-        |
-        |      .. grid-item::
-        |         :columns: 12 8 8 8
-        |
-        |         {}
-        |
-        |      .. grid-item::
-        |         :columns: 12 4 4 4
-        |
-        |         {}
-        |
-        |      .. grid-item::
-        |
-        |         .. card::
-        |            :shadow: none
-        |            :class-header: sd-text-center sd-font-weight-bold sd-px-0 sd-border-right-0 sd-border-left-0 sd-border-top-0
-        |            :class-body: sd-border-0
-        |
-        |            :octicon:`info` Dataset Info
-        |            ^^^
-        |            {}
-        |
-        |      .. grid-item::
-        |
-        |         .. card::
-        |            :shadow: none
-        |            :class-header: sd-text-center sd-font-weight-bold sd-px-0 sd-border-right-0 sd-border-left-0 sd-border-top-0
-        |            :class-body: sd-border-0
-        |
-        |            :octicon:`file` File Info
-        |            ^^^
-        |            {}
-        |
-        |   {}
-        |
-        |
-        """,
+    card_template = _PositionalTemplate(
+        _aligned_dedent(
+            """
+            |.. card::
+            |
+            |   {}
+            |
+            |   ^^^
+            |
+            |   .. grid:: 1 2 2 2
+            |      :margin: 1
+            |
+            |      .. grid-item::
+            |         :columns: 12 8 8 8
+            |
+            |         {}
+            |
+            |      .. grid-item::
+            |         :columns: 12 4 4 4
+            |
+            |         {}
+            |
+            |      .. grid-item::
+            |
+            |         .. card::
+            |            :shadow: none
+            |            :class-header: sd-text-center sd-font-weight-bold sd-px-0 sd-border-right-0 sd-border-left-0 sd-border-top-0
+            |            :class-body: sd-border-0
+            |
+            |            :octicon:`info` Dataset Info
+            |            ^^^
+            |            {}
+            |
+            |      .. grid-item::
+            |
+            |         .. card::
+            |            :shadow: none
+            |            :class-header: sd-text-center sd-font-weight-bold sd-px-0 sd-border-right-0 sd-border-left-0 sd-border-top-0
+            |            :class-body: sd-border-0
+            |
+            |            :octicon:`file` File Info
+            |            ^^^
+            |            {}
+            |
+            |   {}
+            |
+            |
+            """,
+        ),
     )
 
     HEADER_FOOTER_INDENT_LEVEL = 1
@@ -605,62 +907,72 @@ class DatasetCard:
     REF_ANCHOR_INDENT_LEVEL = 2
 
     # Template for dataset name and badges
-    header_template = _aligned_dedent(
-        """
-        |.. grid:: 1
-        |   :margin: 0
-        |
-        |   .. grid-item::
-        |      :class: sd-text-center sd-font-weight-bold sd-fs-5
-        |
-        |      {}
-        |
-        |   .. grid-item::
-        |      :class: sd-text-center
-        |
-        |      {}
-        |
-        """,
-    )[1:-1]
+    header_template = _PositionalTemplate(
+        _aligned_dedent(
+            """
+            |.. grid:: 1
+            |   :margin: 0
+            |
+            |   .. grid-item::
+            |      :class: sd-text-center sd-font-weight-bold sd-fs-5
+            |
+            |      {}
+            |
+            |   .. grid-item::
+            |      :class: sd-text-center
+            |
+            |      {}
+            |
+            """,
+        )[1:-1],
+    )
 
     # Template title with a reference anchor
-    dataset_title_with_ref_template = _aligned_dedent(
-        """
-        |.. _{}:
-        |
-        |{}
-        """,
-    )[1:-1]
+    dataset_title_with_ref_template = _PositionalTemplate(
+        _aligned_dedent(
+            """
+            |.. _{}:
+            |
+            |{}
+            """,
+        )[1:-1],
+    )
 
     # Template for dataset func and doc
-    dataset_info_template = _aligned_dedent(
-        """
-        |{}
-        |
-        |{}
-        """,
-    )[1:-1]
+    dataset_info_template = _PositionalTemplate(
+        _aligned_dedent(
+            """
+            |{}
+            |
+            |{}
+            """,
+        )[1:-1],
+    )
 
     # Template for dataset image
     # The image is encapsulated in its own card
-    image_template = _aligned_dedent(
-        """
-        |.. card::
-        |   :class-body: sd-px-0 sd-py-0 sd-rounded-3
-        |
-        |   .. image:: /{}
-        """,
-    )[1:-1]
+    image_template = _PositionalTemplate(
+        _aligned_dedent(
+            """
+            |.. card::
+            |   :class-body: sd-px-0 sd-py-0 sd-rounded-3
+            |
+            |   .. image:: /{}
+            """,
+        )[1:-1],
+    )
 
-    footer_template = _aligned_dedent(
-        """
-        |+++
-        |.. dropdown:: Data Source
-        |   :icon: mark-github
-        |
-        |   {}
-        """,
-    )[1:-1]
+    footer_template = _PositionalTemplate(
+        _aligned_dedent(
+            """
+            |+++
+            |.. dropdown:: Data Source
+            |   :icon: mark-github
+            |
+            |   {}
+            """,
+        )[1:-1],
+    )
 
     # Format fields in a grid where the first item is a left-justified
     # name and the second is a right-justified value.
@@ -679,30 +991,32 @@ class DatasetCard:
     #       |       LongerValue |
     #       |    ExtraLongValue |
     #       |     Value3 Value4 |
-    field_grid_template = _aligned_dedent(
-        """
-        |.. grid:: auto
-        |   :class-container: sd-col
-        |   :class-row: sd-align-major-justify sd-px-0
-        |   :margin: 1
-        |   :padding: 0
-        |   :gutter: 1
-        |
-        |   .. grid-item::
-        |      :columns: auto
-        |      :class: sd-text-nowrap
-        |
-        |      **{}**
-        |
-        |   .. grid-item::
-        |      :columns: auto
-        |      :class: sd-text-right sd-text-nowrap
-        |      :child-align: justify
-        |
-        |      {}
-        |
-        """,
-    )[1:-1]
+    field_grid_template = _PositionalTemplate(
+        _aligned_dedent(
+            """
+            |.. grid:: auto
+            |   :class-container: sd-col
+            |   :class-row: sd-align-major-justify sd-px-0
+            |   :margin: 1
+            |   :padding: 0
+            |   :gutter: 1
+            |
+            |   .. grid-item::
+            |      :columns: auto
+            |      :class: sd-text-nowrap
+            |
+            |      **{}**
+            |
+            |   .. grid-item::
+            |      :columns: auto
+            |      :class: sd-text-right sd-text-nowrap
+            |      :child-align: justify
+            |
+            |      {}
+            |
+            """,
+        )[1:-1],
+    )
 
     # If the field has more than one value, all additional values are
     # placed in a second grid and aligned towards the 'right' side
@@ -718,16 +1032,18 @@ class DatasetCard:
         |
         """,
     )[1:-1]
-    field_grid_extra_values_item_template = _aligned_dedent(
-        """
-        |   .. grid-item::
-        |      :columns: auto
-        |      :class: sd-text-right sd-text-nowrap
-        |
-        |      {}
-        |
-        """,
-    )[1:-1]
+    field_grid_extra_values_item_template = _PositionalTemplate(
+        _aligned_dedent(
+            """
+            |   .. grid-item::
+            |      :columns: auto
+            |      :class: sd-text-right sd-text-nowrap
+            |
+            |      {}
+            |
+            """,
+        )[1:-1],
+    )
 
     _NOT_AVAILABLE_IMG_PATH = os.path.join(DATASET_GALLERY_DIR, 'not_available.png')
 
@@ -742,6 +1058,11 @@ class DatasetCard:
         self.card = None
         self.ref = None
 
+        # Info collected from the loaded dataset, see `DatasetCard.get_loader_info`
+        self.file_info: Optional[Tuple[Any, ...]] = None
+        self.cell_type_names: Tuple[str, ...] = ()
+        self.files_mtime: Optional[int] = None
+
     def add_badge(self, badge: _BaseDatasetBadge):
         self._badges.append(badge)
 
@@ -751,14 +1072,7 @@ class DatasetCard:
             self.dataset_name,
         )
         # Get thumbnail image path
-        module_name = self.loader._module.__name__.replace('.', '-')
-        ext = DATASET_GALLERY_IMAGE_EXT_DICT.get(self.dataset_name, '.png')
-        if ext is None:
-            img_path = self._create_default_image()
-        else:
-            # Use the first image generated by the .. pyvista_plot:: directive
-            filename = f'{module_name}-{func_name}-1_00_00{ext}'
-            img_path = Path(DATASET_GALLERY_IMAGE_DIR, filename).as_posix()
+        img_path = self._get_img_path(func_name)
 
         # Get rst file and instance metadata
         (
@@ -829,12 +1143,66 @@ class DatasetCard:
 
         return card_no_ref, card_with_ref
 
+    def _get_img_path(self, func_name):
+        """Get the path to the card's thumbnail image."""
+        module_name = self.loader._module.__name__.replace('.', '-')
+        ext = DATASET_GALLERY_IMAGE_EXT_DICT.get(self.dataset_name, '.png')
+        if ext is None:
+            return self._create_default_image()
+        # Use the first image generated by the .. pyvista_plot:: directive
+        filename = f'{module_name}-{func_name}-1_00_00{ext}'
+        return Path(DATASET_GALLERY_IMAGE_DIR, filename).as_posix()
+
+    def get_cache_key(self, sources_key: Tuple[str, ...]) -> str:
+        """Get a key for caching the rst generated by this card.
+
+        The key is computed from inputs to the card which are cheap to fetch,
+        so that the cached rst can be reused if the card is unchanged. It does
+        not require loading the dataset's properties, since the info which
+        identifies the loaded dataset is collected with the rest of the loader info.
+
+        ``sources_key`` identifies the sources shared by all cards, see
+        :meth:`DatasetCardFetcher._get_dataset_info_cache_key`.
+        """
+        name_info = self._generate_dataset_name(self.dataset_name)
+        try:
+            datasource_links = DatasetPropsGenerator.generate_datasource_links(self.loader)
+        except VTKVersionError:
+            # caused by 'download_can'
+            datasource_links = None
+        key_info = (
+            *sources_key,
+            self.dataset_name,
+            name_info,
+            self._get_img_path(name_info[-1]),
+            # the rst of each badge is part of the card
+            tuple(badge.generate() for badge in self._badges),
+            datasource_links,
+            self.file_info,
+            self.files_mtime,
+        )
+        return hashlib.blake2b(repr(key_info).encode('utf-8'), digest_size=16).hexdigest()
+
+    def get_loader_info(self) -> Tuple[Optional[Tuple[Any, ...]], Tuple[str, ...], Optional[int]]:
+        """Get the file info, cell type names, and files mtime of the card's loaded dataset."""
+        try:
+            file_info = (
+                DatasetPropsGenerator._try_getattr(self.loader, '_total_size_bytes'),
+                DatasetPropsGenerator._try_getattr(self.loader, 'num_files'),
+                repr(self.loader.unique_dataset_type),
+            )
+        except VTKVersionError:
+            # caused by 'download_can'
+            file_info = None
+        cell_type_names = tuple(cell_type.name for cell_type in self.loader.unique_cell_types)
+        return file_info, cell_type_names, _get_files_mtime(self.loader)
+
     @staticmethod
     def _generate_dataset_properties(loader):
         try:
             # Get data from loader
             if isinstance(loader, _Downloadable):
-                loader.download()
+                _download_if_missing(loader)
 
             # properties collected by the loader
             file_size = DatasetPropsGenerator.generate_file_size(loader)
@@ -907,37 +1275,42 @@ class DatasetCard:
     @staticmethod
     def _generate_carousel_badges(badges: List[_BaseDatasetBadge]):
         """Sort badges by type and join all badge rst into a single string."""
-        module_badges, datatype_badges, special_badges, category_badges = [], [], [], []
+        sorted_badges: List[List[_BaseDatasetBadge]] = [[] for _ in range(4)]
         for badge in badges:
-            if isinstance(badge, ModuleBadge):
-                module_badges.append(badge)
-            elif isinstance(badge, DataTypeBadge):
-                datatype_badges.append(badge)
-            elif isinstance(badge, SpecialDataTypeBadge):
-                special_badges.append(badge)
-            elif isinstance(badge, CategoryBadge):
-                category_badges.append(badge)
-            elif isinstance(badge, CellTypeBadge):
-                pass  # process these separately
-            elif isinstance(badge, _BaseDatasetBadge):
-                raise NotImplementedError(f'No implementation for badge type {type(badge)}.')
-        all_badges = module_badges + datatype_badges + special_badges + category_badges
-        return ' '.join([badge.generate() for badge in all_badges])
+            badge_type = type(badge)
+            if badge_type not in _CAROUSEL_BADGE_ORDER:
+                # Fall back to the nearest known base class for subclasses of the badge types
+                base_type = next(
+                    (base for base in badge_type.__mro__ if base in _CAROUSEL_BADGE_ORDER),
+                    None,
+                )
+                if base_type is None:
+                    if isinstance(badge, _BaseDatasetBadge):
+                        raise NotImplementedError(
+                            f'No implementation for badge type {type(badge)}.',
+                        )
+                    continue
+                # Cache the order of the subclass so its MRO is only searched once
+                _CAROUSEL_BADGE_ORDER[badge_type] = _CAROUSEL_BADGE_ORDER[base_type]
+            index = _CAROUSEL_BADGE_ORDER[badge_type]
+            if index is not None:
+                sorted_badges[index].append(badge)
+        return ' '.join(badge.generate() for badge in chain.from_iterable(sorted_badges))
 
     @staticmethod
     def _generate_celltype_badges(badges: List[_BaseDatasetBadge]):
         """Sort badges by type and join all badge rst into a single string."""
-        celltype_badges = [badge for badge in badges if isinstance(badge, CellTypeBadge)]
-        rst = '\n'.join([badge.generate() for badge in celltype_badges])
-        if rst == '':
-            rst = '``None``'
-        return rst
+        rst = '\n'.join(badge.generate() for badge in badges if isinstance(badge, CellTypeBadge))
+        return rst or '``None``'
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def _create_default_image():
-        """Process the thumbnail image to ensure it's the right size."""
-        from PIL import Image
+        """Process the thumbnail image to ensure it's the right size.
 
+        The image is the same for all cards, so the result is cached to avoid
+        checking for (or creating) the image file for every card.
+        """
         img_path = Path(DATASET_GALLERY_DIR, 'not_available.png').as_posix()
         if os.path.isfile(img_path):
             return img_path
@@ -949,9 +1322,8 @@ class DatasetCard:
         p.view_xy()
         p.camera.up = (1, IMG_WIDTH / IMG_HEIGHT, 0)
         p.enable_parallel_projection()
-        img_array = p.show(screenshot=True)
-        img = Image.fromarray(img_array)
-        img.save(img_path)
+        # save the screenshot directly rather than round-tripping the array
+        p.show(screenshot=img_path)
         return img_path
 
     @staticmethod
@@ -959,8 +1331,7 @@ class DatasetCard:
         """Format args using a template and indent all formatted lines by some amount."""
         assert template is not None
         assert indent_level is not None
-        formatted = template.format(*args)
-        return _indent_multi_line_string(formatted, indent_level=indent_level)
+        return template.indent(indent_level).format(*args)
 
     @classmethod
     def _generate_field_grid(cls, field_name, field_values):
@@ -988,8 +1359,8 @@ class DatasetCard:
 
         Any fields with a `None` value are completely excluded from the block.
         """
-        field_grids = [DatasetCard._generate_field_grid(name, value) for name, value in fields]
-        block = '\n'.join([grid for grid in field_grids if grid])
+        field_grids = (DatasetCard._generate_field_grid(name, value) for name, value in fields)
+        block = '\n'.join(grid for grid in field_grids if grid)
         return _indent_multi_line_string(block, indent_level=indent_level)
 
     @classmethod
@@ -1120,7 +1491,7 @@ class DatasetPropsGenerator:
         if file_ext:
             file_ext = loader.unique_extension
             file_ext = [file_ext] if isinstance(file_ext, str) else file_ext
-            return '\n'.join(['``\'' + ext + '\'``' for ext in file_ext])
+            return '\n'.join(f"``'{ext}'``" for ext in file_ext)
         return None
 
     @staticmethod
@@ -1130,25 +1501,18 @@ class DatasetPropsGenerator:
         if reader_type is None:
             return "``None``"
         else:
-            reader_type = (
-                repr(loader.unique_reader_type)
-                .replace('<class \'', ':class:`~')
-                .replace('\'>', '`')
-                .replace('(', '')
-                .replace(')', '')
-            ).replace(', ', '\n')
+            reader_type = DatasetPropsGenerator._format_type_repr(reader_type)
         return reader_type
 
     @staticmethod
     def generate_dataset_type(loader: _DatasetLoader):
         """Format dataset type(s) with doc references to dataset class(es)."""
-        return (
-            repr(loader.unique_dataset_type)
-            .replace('<class \'', ':class:`~')
-            .replace('\'>', '`')
-            .replace('(', '')
-            .replace(')', '')
-        ).replace(', ', '\n')
+        return DatasetPropsGenerator._format_type_repr(loader.unique_dataset_type)
+
+    @staticmethod
+    def _format_type_repr(types) -> str:
+        """Format the repr of a type or tuple of types as doc references, one per line."""
+        return TYPE_REPR_PATTERN.sub(lambda match: TYPE_REPR_MAP[match.group()], repr(types))
 
     @staticmethod
     def _generate_dataset_repr(loader: _DatasetLoader, indent_level: int) -> str:
@@ -1156,14 +1520,11 @@ class DatasetPropsGenerator:
 
         The returned string is indented up to the specified indent level.
         """
-        # Replace any hex code memory addresses with ellipses
-        dataset_repr = repr(loader.dataset)
-        dataset_repr = re.sub(
-            pattern=r'0x[0-9a-f]*',
-            repl='...',
-            string=dataset_repr,
+        return _indent_multi_line_string(
+            _get_dataset_repr(loader),
+            indent_size=3,
+            indent_level=indent_level,
         )
-        return _indent_multi_line_string(dataset_repr, indent_size=3, indent_level=indent_level)
 
     @staticmethod
     def generate_datasource_links(loader: _DatasetLoader) -> Optional[str]:
@@ -1177,12 +1538,8 @@ class DatasetPropsGenerator:
         urls = [url] if isinstance(url := loader.source_url_blob, str) else url
 
         # Use dict to create an ordered set to make sure links are unique
-        url_dict = {}
-        for name, url in zip(names, urls):
-            url_dict[url] = name
-
-        rst_links = [_rst_link(name, url) for url, name in url_dict.items()]
-        return '\n'.join(rst_links)
+        url_dict = dict(zip(urls, names))
+        return '\n'.join(_rst_link(name, url) for url, name in url_dict.items())
 
     @staticmethod
     def generate_n_cells(loader):
@@ -1263,6 +1620,16 @@ class DatasetCardFetcher:
     DATASET_CARDS_RST_REF: ClassVar[Dict[str, str]] = {}
     DATASET_CARDS_RST: ClassVar[Dict[str, str]] = {}
 
+    # Dict of metadata for all dataset objects of each dataset
+    # The metadata is used to filter the datasets for each carousel
+    DATASET_META: ClassVar[Dict[str, Tuple[Dict[str, Any], ...]]] = {}
+
+    # Dict of dataset names, keyed by the type of the dataset objects
+    DATATYPE_INDEX: ClassVar[Dict[Type[DatasetObject], List[str]]] = {}
+
+    # Dict of multiblock dataset names, keyed by the kind of multiblock
+    MULTIBLOCK_INDEX: ClassVar[Dict[str, List[str]]] = {}
+
     @classmethod
     def _add_dataset_card(cls, dataset_name: str, dataset_loader: _DatasetLoader):
         """Add a new dataset card so that it can be fetched later."""
@@ -1270,54 +1637,217 @@ class DatasetCardFetcher:
 
     @classmethod
     def init_cards(cls):
-        """Download and load all datasets and initialize a card object for each dataset."""
-        cls._init_cards_from_module(pv.examples.examples)
-        cls._init_cards_from_module(pv.examples.downloads)
+        """Download and load all datasets and initialize a card object for each dataset.
+
+        The info collected from the loaded datasets is cached to disk. If the
+        cache is valid, the datasets are not loaded until their card's rst
+        needs to be generated.
+        """
+        cache_key = cls._get_dataset_info_cache_key()
+        dataset_info = cls._read_dataset_info_cache(cache_key)
+        if dataset_info is None:
+            cls._download_all_from_module(pv.examples.downloads)
+        cls._init_cards_from_module(pv.examples.examples, dataset_info)
+        cls._init_cards_from_module(pv.examples.downloads, dataset_info)
         cls.DATASET_CARDS_OBJ = dict(sorted(cls.DATASET_CARDS_OBJ.items()))
+        if dataset_info is None:
+            cls._write_dataset_info_cache(cache_key)
+
+    @staticmethod
+    def _get_dataset_info_cache_key() -> Tuple[str, ...]:
+        """Get a key for the dataset info cache from the sources which define the datasets."""
+        modules = (pv.examples.examples, pv.examples.downloads, pv.examples._dataset_loader)
+        return (
+            _MODULE_HASH,
+            _CORE_HASH,
+            pyvista.__version__,
+            *(_hash_file(module.__file__).hex() for module in modules),
+        )
+
+    @staticmethod
+    def _read_dataset_info_cache(cache_key) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Read the cached info of all datasets, or return None if the cache is invalid.
+
+        The cache is ignored if a rebuild is forced with ``PYVISTA_DOC_REBUILD=1``.
+        """
+        if _rebuild_requested():
+            return None
+        try:
+            with Path(DATASET_INFO_CACHE_PATH).open('rb') as f:
+                cache = pickle.load(f)
+            return cache['info'] if cache['key'] == cache_key else None
+        except (
+            OSError,
+            EOFError,
+            pickle.UnpicklingError,
+            AttributeError,
+            ImportError,
+            KeyError,
+            TypeError,
+            ValueError,
+        ):
+            # Unpickling may fail in many ways, e.g. if a pickled class was moved
+            # or renamed. The cache is rebuilt in any case
+            return None
+
+    @classmethod
+    def _write_dataset_info_cache(cls, cache_key):
+        """Cache the info collected from the loaded datasets to disk."""
+        info = {
+            name: {
+                'meta': cls.DATASET_META[name],
+                'file_info': card.file_info,
+                'cell_type_names': card.cell_type_names,
+                'files_mtime': card.files_mtime,
+            }
+            for name, card in cls.DATASET_CARDS_OBJ.items()
+        }
+        cache_path = Path(DATASET_INFO_CACHE_PATH)
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with cache_path.open('wb') as f:
+            pickle.dump({'key': cache_key, 'info': info}, f)
 
     @classmethod
     def clear_datasets(cls):
         """Clear loaded datasets."""
-        [loader.clear_dataset() for _, loader in cls.fetch_all_dataset_loaders()]
+        for _, loader in cls.fetch_all_dataset_loaders():
+            loader.clear_dataset()
 
-    @classmethod
-    def _init_cards_from_module(cls, module: ModuleType):
-        # Collect all `_dataset_<name>` file loaders from the module
-        module_members: Dict[str, FunctionType] = dict(inspect.getmembers(module))
+    @staticmethod
+    def _download_all_from_module(module: ModuleType):
+        """Download the files of all `_dataset_<name>` loaders in a module concurrently.
 
-        for name, item in sorted(module_members.items()):
-            # Extract data set name from loader name
+        Downloading is dominated by network latency, so the files are fetched
+        using a thread pool. Each source file is only downloaded once, even if
+        it is shared by multiple loaders (e.g. files from the same archive).
+        """
+        files: Dict[str, _DownloadableFile] = {}
+        for _, loader in DatasetCardFetcher._fetch_dataset_loaders_from_module(module):
+            try:
+                if isinstance(loader, _Downloadable):
+                    for file in _iter_downloadable_files(loader):
+                        files.setdefault(file.source_name, file)
+            except VTKVersionError:
+                # caused by 'download_can', this error is handled later
+                pass
+
+        # The default number of workers scales with the number of CPUs, but
+        # downloading is bound by network latency rather than CPU
+        with ThreadPoolExecutor(max_workers=MAX_DOWNLOAD_WORKERS) as executor:
+            # Consume the results to re-raise any exceptions from the workers
+            list(executor.map(_download_if_missing, files.values()))
 
-            if name.startswith('_dataset_') and isinstance(item, _DatasetLoader):
+    @staticmethod
+    def _fetch_dataset_loaders_from_module(module: ModuleType) -> List[Tuple[str, _DatasetLoader]]:
+        """Return all `_dataset_<name>` loaders from the module, sorted by name."""
+        # Filter the module's namespace first so that only the loaders are sorted
+        loaders = [
+            (name, item)
+            for name, item in vars(module).items()
+            if name.startswith('_dataset_') and isinstance(item, _DatasetLoader)
+        ]
+        loaders.sort(key=itemgetter(0))
+        return loaders
 
-                # Create a card for this dataset
-                dataset_name = name.replace('_dataset_', '')
-                dataset_loader = item
-                # Store module as a dynamic property for access later
-                dataset_loader._module = module
+    @classmethod
+    def _init_cards_from_module(
+        cls,
+        module: ModuleType,
+        dataset_info: Optional[Dict[str, Dict[str, Any]]] = None,
+    ):
+        # The indexes are outdated once new datasets are added
+        cls.DATATYPE_INDEX = {}
+        cls.MULTIBLOCK_INDEX = {}
+        # Collect all `_dataset_<name>` file loaders from the module
+        for name, dataset_loader in cls._fetch_dataset_loaders_from_module(module):
+            # Extract data set name from loader name
+            # The name is interned since it is used as a key for many lookups
+            dataset_name = sys.intern(name.replace('_dataset_', ''))
+            # Store module as a dynamic property for access later
+            dataset_loader._module = module
+
+            # Create a card for this dataset
+            cls._add_dataset_card(dataset_name, dataset_loader)
+            card = cls.DATASET_CARDS_OBJ[dataset_name]
+
+            info = dataset_info.get(dataset_name) if dataset_info is not None else None
+            # The info is outdated if the dataset's files were downloaded again
+            if info is not None and info['files_mtime'] == _get_files_mtime(dataset_loader):
+                # Use cached info instead of loading the dataset
+                cls.DATASET_META[dataset_name] = info['meta']
+                card.file_info, card.cell_type_names = info['file_info'], info['cell_type_names']
+                card.files_mtime = info['files_mtime']
+                continue
+
+            cls._load_dataset(dataset_loader)
+            cls.DATASET_META[dataset_name] = tuple(
+                cls._get_dataset_object_meta(obj) for obj in dataset_loader.dataset_iterable
+            )
+            card.file_info, card.cell_type_names, card.files_mtime = card.get_loader_info()
 
-                cls._add_dataset_card(dataset_name, dataset_loader)
+    @staticmethod
+    def _load_dataset(dataset_loader: _DatasetLoader):
+        """Download (if needed) and load the dataset."""
+        try:
+            if isinstance(dataset_loader, _Downloadable):
+                _download_if_missing(dataset_loader)
+        except pyvista.VTKVersionError:
+            # caused by 'download_can', this error is handled later
+            pass
+        else:
+            dataset_loader.load_and_store_dataset()
+            assert dataset_loader.dataset is not None
 
-                # Load data
-                try:
-                    if isinstance(dataset_loader, _Downloadable):
-                        dataset_loader.download()
-                except pyvista.VTKVersionError:
-                    # caused by 'download_can', this error is handled later
-                    pass
-                else:
-                    dataset_loader.load_and_store_dataset()
-                    assert dataset_loader.dataset is not None
+    @staticmethod
+    def _get_dataset_object_meta(obj: Optional[DatasetObject]) -> Dict[str, Any]:
+        """Get the metadata of a dataset object used for filtering datasets."""
+        meta: Dict[str, Any] = {'type': type(obj)}
+        if isinstance(obj, pv.PolyData):
+            meta.update(n_cells=obj.n_cells, n_verts=obj.n_verts, n_lines=obj.n_lines)
+        elif isinstance(obj, pv.ImageData):
+            meta['dimensions'] = obj.dimensions
+        elif isinstance(obj, pv.Texture):
+            meta['cube_map'] = obj.cube_map
+        return meta
 
     @classmethod
     def generate_rst_all_cards(cls):
-        """Generate formatted rst output for all cards."""
-        for name in cls.DATASET_CARDS_OBJ:
-            card, card_with_ref = cls.DATASET_CARDS_OBJ[name].generate()
+        """Generate formatted rst output for all cards.
+
+        The rst of each card is cached to disk. Later doc builds reuse the
+        cached rst if the card's cache key has not changed, unless a rebuild
+        is forced with ``PYVISTA_DOC_REBUILD=1``.
+        """
+        cache_path = Path(DATASET_CARDS_CACHE_PATH)
+        if _rebuild_requested():
+            cache = {}
+        else:
+            try:
+                cache = json.loads(cache_path.read_text(encoding='utf-8'))
+            except (FileNotFoundError, json.JSONDecodeError):
+                cache = {}
+
+        # The source files are hashed once for all cards
+        sources_key = cls._get_dataset_info_cache_key()
+        new_cache = {}
+        for name, card_obj in cls.DATASET_CARDS_OBJ.items():
+            key = card_obj.get_cache_key(sources_key)
+            cached = cache.get(name)
+            if cached is not None and cached['key'] == key:
+                card, card_with_ref = cached['card'], cached['card_with_ref']
+            else:
+                if card_obj.loader.dataset is None:
+                    # dataset is not loaded if its info was cached
+                    cls._load_dataset(card_obj.loader)
+                card, card_with_ref = card_obj.generate()
+            new_cache[name] = {'key': key, 'card': card, 'card_with_ref': card_with_ref}
             # indent one level from the carousel header directive
             cls.DATASET_CARDS_RST_REF[name] = _pad_lines(card_with_ref, pad_left='   ')
             cls.DATASET_CARDS_RST[name] = _pad_lines(card, pad_left='   ')
 
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(json.dumps(new_cache), encoding='utf-8')
+
     @classmethod
     def generate_alphabet_index(cls, dataset_names):
         """Generate single-letter index buttons which link to the datasets by their first letter."""
@@ -1364,24 +1894,36 @@ class DatasetCardFetcher:
         return _generate_grid('\n'.join(buttons))
 
     @classmethod
-    def add_badge_to_cards(cls, dataset_names: List[str], badge: Optional[_BaseDatasetBadge]):
-        """Add a single badge to all specified datasets."""
-        if badge:
-            for dataset_name in dataset_names:
-                cls.DATASET_CARDS_OBJ[dataset_name].add_badge(badge)
+    def add_badges_to_cards(cls, badges: Dict[str, List[_BaseDatasetBadge]]):
+        """Add badges to the cards in a single pass, given a list of badges for each dataset."""
+        for dataset_name, card in cls.DATASET_CARDS_OBJ.items():
+            for badge in badges.get(dataset_name, ()):
+                card.add_badge(badge)
 
     @classmethod
     def add_cell_badges_to_all_cards(cls):
         """Add cell type badge(s) to every dataset."""
         for card in cls.DATASET_CARDS_OBJ.values():
-            for cell_type in card.loader.unique_cell_types:
-                card.add_badge(CellTypeBadge(cell_type.name))
+            for cell_type_name in card.cell_type_names:
+                card.add_badge(CellTypeBadge(cell_type_name))
 
     @classmethod
     def fetch_dataset_names_by_datatype(cls, datatype) -> Iterator[str]:
-        for name, dataset_iterable in cls.fetch_all_dataset_objects():
-            if datatype in [type(data) for data in dataset_iterable]:
-                yield name
+        # All datasets are indexed by type in a single pass which is shared
+        # by all carousels
+        if not cls.DATATYPE_INDEX:
+            cls.DATATYPE_INDEX = cls._index_datatypes()
+        return iter(cls.DATATYPE_INDEX.get(datatype, []))
+
+    @classmethod
+    def _index_datatypes(cls) -> Dict[Type[DatasetObject], List[str]]:
+        """Index the dataset names by the exact type of each dataset object."""
+        index: Dict[Type[DatasetObject], List[str]] = {}
+        for name, dataset_types in cls.fetch_all_dataset_types():
+            # Add each name only once per type
+            for datatype in dict.fromkeys(dataset_types):
+                index.setdefault(datatype, []).append(name)
+        return index
 
     @classmethod
     def fetch_dataset_names_by_module(cls, module) -> Iterator[str]:
@@ -1394,6 +1936,16 @@ class DatasetCardFetcher:
         for name, card in DatasetCardFetcher.DATASET_CARDS_OBJ.items():
             yield name, card.loader.dataset_iterable
 
+    @classmethod
+    def fetch_all_dataset_meta(cls) -> Iterator[Tuple[str, Tuple[Dict[str, Any], ...]]]:
+        for name in DatasetCardFetcher.DATASET_CARDS_OBJ:
+            yield name, cls.DATASET_META[name]
+
+    @classmethod
+    def fetch_all_dataset_types(cls) -> Iterator[Tuple[str, Tuple[Type[DatasetObject], ...]]]:
+        for name, dataset_meta in cls.fetch_all_dataset_meta():
+            yield name, tuple(meta['type'] for meta in dataset_meta)
+
     @classmethod
     def fetch_all_dataset_loaders(cls) -> Iterator[Tuple[str, _DatasetLoader]]:
         for name, card in DatasetCardFetcher.DATASET_CARDS_OBJ.items():
@@ -1401,41 +1953,50 @@ class DatasetCardFetcher:
 
     @classmethod
     def fetch_and_filter(cls, filter_func: Callable[..., bool]) -> List[str]:
-        """Return dataset names where any dataset object returns 'True' for a given function."""
-        names_dict: Dict[str, None] = {}  # Use dict as an ordered set
-        for name, dataset_iterable in cls.fetch_all_dataset_objects():
-            for obj in dataset_iterable:
-                try:
-                    keep = filter_func(obj)
-                except AttributeError:
-                    keep = False
-                if keep:
-                    names_dict[name] = None
-        names_list = list(names_dict.keys())
+        """Return dataset names where any dataset object returns 'True' for a given function.
+
+        The function is called with the metadata of each dataset object rather than
+        the object itself. See :meth:`_get_dataset_object_meta`.
+        """
+
+        def keep(meta):
+            try:
+                return filter_func(meta)
+            except KeyError:
+                return False
+
+        names_list = [
+            name
+            for name, dataset_meta in cls.fetch_all_dataset_meta()
+            if any(keep(meta) for meta in dataset_meta)
+        ]
         assert len(names_list) > 0, f"No datasets were matched by the filter {filter_func}."
         return names_list
 
     @classmethod
     def fetch_multiblock(cls, kind: Literal['hetero', 'homo', 'single']):
-        dataset_names = []
-        for name, dataset_objects in cls.fetch_all_dataset_objects():
-            types_list = [type(obj) for obj in dataset_objects]
+        # All multiblock datasets are classified in a single pass which is
+        # shared by all multiblock carousels
+        if not cls.MULTIBLOCK_INDEX:
+            cls.MULTIBLOCK_INDEX = cls._index_multiblock()
+        return list(cls.MULTIBLOCK_INDEX[kind])
+
+    @classmethod
+    def _index_multiblock(cls) -> Dict[str, List[str]]:
+        """Classify multiblock datasets by their number of blocks and unique block types."""
+        index: Dict[str, List[str]] = {'hetero': [], 'homo': [], 'single': []}
+        for name, dataset_types in cls.fetch_all_dataset_types():
+            types_list = list(dataset_types)
             if pv.MultiBlock in types_list:
                 types_list.remove(pv.MultiBlock)
-                num_datasets = len(types_list)
-                if (
-                    num_datasets == 1
-                    and kind == 'single'
-                    or (
-                        num_datasets >= 2
-                        and len(set(types_list)) == 1
-                        and kind == 'homo'
-                        or len(set(types_list)) > 1
-                        and kind == 'hetero'
-                    )
-                ):
-                    dataset_names.append(name)
-        return dataset_names
+                num_datasets, num_types = len(types_list), len(set(types_list))
+                if num_types > 1:
+                    index['hetero'].append(name)
+                elif num_datasets >= 2:
+                    index['homo'].append(name)
+                elif num_datasets == 1:
+                    index['single'].append(name)
+        return index
 
 
 @dataclass
@@ -1468,7 +2029,11 @@ class _BaseDatasetBadge:
         self.semantic_color: _BaseDatasetBadge.SemanticColorEnum = None  # type: ignore[assignment]
 
     def generate(self):
-        # Generate rst
+        return self._rst
+
+    @cached_property
+    def _rst(self) -> str:
+        # Generate rst once, since badges are shared by many cards
         color = self.semantic_color.name
         name = self.name
         line = '-line' if hasattr(self, 'filled') and not self.filled else ''
@@ -1562,6 +2127,17 @@ class CellTypeBadge(_BaseDatasetBadge):
         cls.semantic_color = _BaseDatasetBadge.SemanticColorEnum.dark
 
 
+# Order in which badges are shown on a card's carousel, keyed by badge type.
+# Cell type badges are not shown on the carousel and are processed separately.
+_CAROUSEL_BADGE_ORDER: Dict[Type[_BaseDatasetBadge], Optional[int]] = {
+    ModuleBadge: 0,
+    DataTypeBadge: 1,
+    SpecialDataTypeBadge: 2,
+    CategoryBadge: 3,
+    CellTypeBadge: None,
+}
+
+
 class DatasetGalleryCarousel(DocTable):
     # Print the doc, badges, and dataset count
     # The header defines the start of the card carousel
@@ -1771,8 +2347,8 @@ class PointCloudCarousel(DatasetGalleryCarousel):
     @classmethod
     def fetch_dataset_names(cls):
         pointset_names = DatasetCardFetcher.fetch_dataset_names_by_datatype(pv.PointSet)
-        vertex_polydata_filter = (
-            lambda poly: isinstance(poly, pv.PolyData) and poly.n_verts == poly.n_cells
+        vertex_polydata_filter = lambda meta: (
+            issubclass(meta['type'], pv.PolyData) and meta['n_verts'] == meta['n_cells']
         )
         vertex_polydata_names = DatasetCardFetcher.fetch_and_filter(vertex_polydata_filter)
         return sorted(list(pointset_names) + list(vertex_polydata_names))
@@ -1787,9 +2363,9 @@ class SurfaceMeshCarousel(DatasetGalleryCarousel):
 
     @classmethod
     def fetch_dataset_names(cls):
-        surface_polydata_filter = (
-            lambda poly: isinstance(poly, pv.PolyData)
-            and (poly.n_cells - poly.n_verts - poly.n_lines) > 0
+        surface_polydata_filter = lambda meta: (
+            issubclass(meta['type'], pv.PolyData)
+            and (meta['n_cells'] - meta['n_verts'] - meta['n_lines']) > 0
         )
         surface_polydata_names = DatasetCardFetcher.fetch_and_filter(surface_polydata_filter)
         return sorted(surface_polydata_names)
@@ -1828,8 +2404,8 @@ class ImageData3DCarousel(DatasetGalleryCarousel):
 
     @classmethod
     def fetch_dataset_names(cls):
-        image_3d_filter = lambda img: isinstance(img, pv.ImageData) and not np.any(
-            np.array(img.dimensions) == 1,
+        image_3d_filter = lambda meta: (
+            issubclass(meta['type'], pv.ImageData) and 1 not in meta['dimensions']
         )
         return DatasetCardFetcher.fetch_and_filter(image_3d_filter)
 
@@ -1843,8 +2419,8 @@ class ImageData2DCarousel(DatasetGalleryCarousel):
 
     @classmethod
     def fetch_dataset_names(cls):
-        image_2d_filter = lambda img: isinstance(img, pv.ImageData) and np.any(
-            np.array(img.dimensions) == 1,
+        image_2d_filter = lambda meta: (
+            issubclass(meta['type'], pv.ImageData) and 1 in meta['dimensions']
         )
         return DatasetCardFetcher.fetch_and_filter(image_2d_filter)
 
@@ -1870,7 +2446,7 @@ class CubemapCarousel(DatasetGalleryCarousel):
 
     @classmethod
     def fetch_dataset_names(cls):
-        cube_map_filter = lambda cubemap: isinstance(cubemap, pv.Texture) and cubemap.cube_map
+        cube_map_filter = lambda meta: issubclass(meta['type'], pv.Texture) and meta['cube_map']
         return DatasetCardFetcher.fetch_and_filter(cube_map_filter)
 
 
@@ -1931,10 +2507,14 @@ class MiscCarousel(DatasetGalleryCarousel):
 
     @classmethod
     def fetch_dataset_names(cls):
-        misc_dataset_filter = lambda obj: not isinstance(
-            obj,
-            (pv.MultiBlock, pv.Texture, pv.DataSet),
-        )
+        # Classify each unique type once and filter the datasets by set membership
+        misc_types = {
+            typ
+            for _, dataset_types in DatasetCardFetcher.fetch_all_dataset_types()
+            for typ in dataset_types
+            if not issubclass(typ, (pv.MultiBlock, pv.Texture, pv.DataSet))
+        }
+        misc_dataset_filter = lambda meta: meta['type'] in misc_types
         return DatasetCardFetcher.fetch_and_filter(misc_dataset_filter)
 
 
@@ -1945,9 +2525,9 @@ class MedicalCarousel(DatasetGalleryCarousel):
     doc = 'Medical datasets.'
     badge = CategoryBadge('Medical', ref='medical_dataset_gallery')
 
-    @classmethod
-    def fetch_dataset_names(cls):
-        return sorted(
+    # Names of all medical datasets, sorted once when the class is defined
+    _medical_dataset_names: Tuple[str, ...] = tuple(
+        sorted(
             [
                 'brain',
                 'brain_atlas_with_sides',
@@ -1966,21 +2546,30 @@ class MedicalCarousel(DatasetGalleryCarousel):
                 'whole_body_ct_female',
                 'whole_body_ct_male',
             ],
-        )
+        ),
+    )
+
+    @classmethod
+    def fetch_dataset_names(cls):
+        return cls._medical_dataset_names
 
 
 def make_all_carousels(carousels: List[DatasetGalleryCarousel]):
     # Load datasets and create card objects
     DatasetCardFetcher.init_cards()
 
-    # Create lists of dataset names for each carousel
-    [carousel.init_dataset_names() for carousel in carousels]
+    # Create lists of dataset names for each carousel and collect the
+    # carousel badges for each dataset
+    badges: Dict[str, List[_BaseDatasetBadge]] = {}
+    for carousel in carousels:
+        carousel.init_dataset_names()
+        if carousel.badge:
+            for dataset_name in carousel.dataset_names:
+                badges.setdefault(dataset_name, []).append(carousel.badge)
 
     # Add carousel badges to cards
-    [
-        DatasetCardFetcher.add_badge_to_cards(carousel.dataset_names, carousel.badge)
-        for carousel in carousels
-    ]
+    DatasetCardFetcher.add_badges_to_cards(badges)
+
     # Add celltype badges to cards
     DatasetCardFetcher.add_cell_badges_to_all_cards()
 
@@ -1988,7 +2577,8 @@ def make_all_carousels(carousels: List[DatasetGalleryCarousel]):
     DatasetCardFetcher.generate_rst_all_cards()
 
     # Generate rst for all carousels
-    [carousel.generate() for carousel in carousels]
+    for carousel in carousels:
+        carousel.generate()
 
     # Clear loaded datasets from memory
     DatasetCardFetcher.clear_datasets()
@@ -2021,13 +2611,23 @@ CAROUSEL_LIST = [
 
 
 def make_all_tables():
-    # Make color and chart tables
-    os.makedirs(CHARTS_IMAGE_DIR, exist_ok=True)
-    LineStyleTable.generate()
-    MarkerStyleTable.generate()
-    ColorSchemeTable.generate()
-    ColorTable.generate()
-
-    # Make dataset gallery carousels
-    os.makedirs(DATASET_GALLERY_DIR, exist_ok=True)
-    make_all_carousels(CAROUSEL_LIST)
+    try:
+        # Make color and chart tables
+        os.makedirs(CHARTS_IMAGE_DIR, exist_ok=True)
+        LineStyleTable.generate()
+        MarkerStyleTable.generate()
+        ColorSchemeTable.generate()
+        ColorTable.generate()
+
+        # Make dataset gallery carousels
+        os.makedirs(DATASET_GALLERY_DIR, exist_ok=True)
+        make_all_carousels(CAROUSEL_LIST)
+    finally:
+        # Close any plotters once all tables are made rather than after each table
+        pv.close_all()
+
+
+if __name__ == "__main__":
+    # Guard the entry point so that the worker processes used to generate
+    # the table images can safely import this module
+    make_all_tables()
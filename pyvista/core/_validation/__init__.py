@@ -1,35 +1,116 @@
-"""Input _validation functions."""
-
-from pyvista.core._validation.check import (  # noqa: F401
-    check_contains,
-    check_finite,
-    check_greater_than,
-    check_instance,
-    check_integer,
-    check_iterable,
-    check_iterable_items,
-    check_length,
-    check_less_than,
-    check_nonnegative,
-    check_number,
-    check_range,
-    check_real,
-    check_sequence,
-    check_shape,
-    check_sorted,
-    check_string,
-    check_subdtype,
-    check_type,
-)
-from pyvista.core._validation.validate import (  # noqa: F401
-    validate_array,
-    validate_array3,
-    validate_arrayN,
-    validate_arrayN_uintlike,
-    validate_arrayNx3,
-    validate_axes,
-    validate_data_range,
-    validate_number,
-    validate_transform3x3,
-    validate_transform4x4,
-)
+"""Input _validation functions.
+
+The functions are imported lazily from their submodules when first accessed.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+# Import all functions for type checkers and linters
+if TYPE_CHECKING:  # pragma: no cover
+    from pyvista.core._validation.check import (  # noqa: F401
+        check_contains,
+        check_finite,
+        check_greater_than,
+        check_instance,
+        check_integer,
+        check_iterable,
+        check_iterable_items,
+        check_length,
+        check_less_than,
+        check_nonnegative,
+        check_number,
+        check_range,
+        check_real,
+        check_sequence,
+        check_shape,
+        check_sorted,
+        check_string,
+        check_subdtype,
+        check_type,
+    )
+    from pyvista.core._validation.validate import (  # noqa: F401
+        validate_array,
+        validate_array3,
+        validate_arrayN,
+        validate_arrayN_uintlike,
+        validate_arrayNx3,
+        validate_axes,
+        validate_data_range,
+        validate_number,
+        validate_transform3x3,
+        validate_transform4x4,
+    )
+
+# Submodule which defines each function
+_LAZY_IMPORTS = {
+    **dict.fromkeys(
+        [
+            'check_contains',
+            'check_finite',
+            'check_greater_than',
+            'check_instance',
+            'check_integer',
+            'check_iterable',
+            'check_iterable_items',
+            'check_length',
+            'check_less_than',
+            'check_nonnegative',
+            'check_number',
+            'check_range',
+            'check_real',
+            'check_sequence',
+            'check_shape',
+            'check_sorted',
+            'check_string',
+            'check_subdtype',
+            'check_type',
+        ],
+        'check',
+    ),
+    **dict.fromkeys(
+        [
+            'validate_array',
+            'validate_array3',
+            'validate_arrayN',
+            'validate_arrayN_uintlike',
+            'validate_arrayNx3',
+            'validate_axes',
+            'validate_data_range',
+            'validate_number',
+            'validate_transform3x3',
+            'validate_transform4x4',
+        ],
+        'validate',
+    ),
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name):
+    """Import the function ``name`` from its submodule on first access.
+
+    The function is stored in ``globals()`` so that this is only called
+    once per function.
+
+    Raises
+    ------
+    AttributeError
+        If the attribute is not a validation function.
+
+    """
+    try:
+        submodule = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}') from None
+    value = getattr(importlib.import_module(f'{__name__}.{submodule}'), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Include the lazily imported functions in ``dir()``."""
+    return sorted({*globals(), *_LAZY_IMPORTS})
@@ -2,6 +2,14 @@
 
 import numpy as np
 
+# needed to support numpy <1.25
+# needed to support vtk 9.0.3
+# check for removal when support for vtk 9.0.3 is removed
+try:
+    VisibleDeprecationWarning = np.exceptions.VisibleDeprecationWarning
+except AttributeError:
+    VisibleDeprecationWarning = np.VisibleDeprecationWarning
+
 
 def _cast_to_list(arr):
     """Cast an array to a nested list.
@@ -32,12 +40,21 @@ def _cast_to_tuple(arr):
     tuple
         Tuple or nested tuple array.
     """
-    arr = _cast_to_numpy(arr).tolist()
+    arr = _cast_to_numpy(arr)
+    ndim = arr.ndim
+    arr = arr.tolist()
+    if ndim == 0:
+        return arr
+    if ndim == 1:
+        return tuple(arr)
 
-    def _to_tuple(s):
-        return tuple(_to_tuple(i) for i in s) if isinstance(s, list) else s
+    def _to_tuple(s, depth):
+        # Convert the innermost lists with `map` instead of visiting each element
+        if depth == 2:
+            return tuple(map(tuple, s))
+        return tuple(_to_tuple(i, depth - 1) for i in s)
 
-    return _to_tuple(arr)
+    return _to_tuple(arr, ndim)
 
 
 def _cast_to_numpy(arr, /, *, as_any=True, dtype=None, copy=False, must_be_real=False):
@@ -89,25 +106,22 @@ def _cast_to_numpy(arr, /, *, as_any=True, dtype=None, copy=False, must_be_real=
         NumPy ndarray.
 
     """
-    # needed to support numpy <1.25
-    # needed to support vtk 9.0.3
-    # check for removal when support for vtk 9.0.3 is removed
-    try:
-        VisibleDeprecationWarning = np.exceptions.VisibleDeprecationWarning
-    except AttributeError:
-        VisibleDeprecationWarning = np.VisibleDeprecationWarning
-
-    try:
-        if as_any:
-            out = np.asanyarray(arr, dtype=dtype)
-            if copy:
-                out = out.copy()
-        else:
-            out = np.array(arr, dtype=dtype, copy=copy)
-    except (ValueError, VisibleDeprecationWarning) as e:
-        raise ValueError(f"Input cannot be cast as {np.ndarray}.") from e
+    if as_any and not copy and dtype is None and isinstance(arr, np.ndarray):
+        # Fast path, the array is returned as-is
+        out = arr
+    else:
+        try:
+            if as_any:
+                out = np.asanyarray(arr, dtype=dtype)
+                if copy:
+                    out = out.copy()
+            else:
+                out = np.array(arr, dtype=dtype, copy=copy)
+        except (ValueError, VisibleDeprecationWarning) as e:
+            raise ValueError(f"Input cannot be cast as {np.ndarray}.") from e
     if must_be_real is True and not issubclass(out.dtype.type, (np.floating, np.integer)):
         raise TypeError(f"Array must have real numbers. Got dtype {out.dtype.type}")
-    elif out.dtype.name == 'object':
+    elif out.dtype.kind == 'O':
+        # Compare the kind since the dtype's name is computed in Python
         raise TypeError("Object arrays are not supported.")
     return out
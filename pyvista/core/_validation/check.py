@@ -13,6 +13,7 @@ A ``check`` function typically:
 from __future__ import annotations
 
 from collections.abc import Iterable, Sequence
+from functools import lru_cache
 from numbers import Number
 from typing import Tuple, Union, get_args, get_origin
 
@@ -21,6 +22,12 @@ import numpy as np
 from pyvista.core._validation._cast_array import _cast_to_numpy
 
 
+@lru_cache(maxsize=256)
+def _issubdtype_cached(arg1, arg2):
+    """Return ``np.issubdtype`` for hashable dtype-like inputs."""
+    return np.issubdtype(arg1, arg2)
+
+
 def check_subdtype(arg1, arg2, /, *, name='Input'):
     """Check if a data-type is a subtype of another data-type(s).
 
@@ -76,7 +83,13 @@ def check_subdtype(arg1, arg2, /, *, name='Input'):
     if not isinstance(arg2, (list, tuple)):
         arg2 = [arg2]
     for d in arg2:
-        if np.issubdtype(arg1, d):
+        try:
+            # The dtype hierarchy is fixed, so the result can be cached
+            is_subdtype = _issubdtype_cached(arg1, d)
+        except TypeError:
+            # Unhashable dtype-like input
+            is_subdtype = np.issubdtype(arg1, d)
+        if is_subdtype:
             return
     msg = f"{name} has incorrect dtype of '{arg1}'. "
     if len(arg2) == 1:
@@ -298,7 +311,8 @@ def check_integer(arr, /, *, strict=False, name="Array"):
     arr = arr if isinstance(arr, np.ndarray) else _cast_to_numpy(arr)
     if strict:
         check_subdtype(arr, np.integer)
-    elif not np.array_equal(arr, np.floor(arr)):
+    # Integer arrays are always integer-like, so only scan other dtypes
+    elif arr.dtype.kind not in 'iu' and not np.array_equal(arr, np.floor(arr)):
         raise ValueError(f"{name} must have integer-like values.")
 
 
@@ -549,7 +563,8 @@ def check_shape(
     array_shape = arr.shape
     for shp in shape:
         shp = _validate_shape_value(shp)
-        if _shape_is_allowed(array_shape, shp):
+        # Compare the tuples directly before matching any `-1` dimensions
+        if shp == array_shape or _shape_is_allowed(array_shape, shp):
             return
 
     msg = f"{name} has shape {arr.shape} which is not allowed. "
@@ -1046,6 +1061,9 @@ def check_length(
             )
 
 
+_COMMON_SHAPES = frozenset([(), (-1,), (1,), (3,), (2,), (1, 3), (-1, 3)])
+
+
 def _validate_shape_value(shape: Union[int, Tuple[int, ...], Tuple[None]]):
     """Validate shape-like input and return its tuple representation."""
     if shape is None:
@@ -1055,7 +1073,7 @@ def _validate_shape_value(shape: Union[int, Tuple[int, ...], Tuple[None]]):
         raise TypeError("`None` is not a valid shape. Use `()` instead.")
 
     # Return early for common inputs
-    if shape in [(), (-1,), (1,), (3,), (2,), (1, 3), (-1, 3)]:
+    if type(shape) is tuple and shape in _COMMON_SHAPES:
         return shape
 
     def _is_valid_dim(d):
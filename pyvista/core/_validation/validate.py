@@ -15,8 +15,8 @@ A ``validate`` function typically:
 
 from __future__ import annotations
 
-import inspect
-from itertools import product
+import math
+import sys
 from typing import TYPE_CHECKING, Any, Dict, Literal, Tuple, Union
 
 import numpy as np
@@ -41,6 +41,33 @@ if TYPE_CHECKING:  # pragma: no cover
     from pyvista.core._typing_core._array_like import NumpyArray
 
 
+# Shapes allowed by the specialized validators
+# These are defined once here rather than rebuilt with each call
+_NUMBER_SHAPES = [(), (1,)]
+_ARRAYNx3_SHAPES = [3, (-1, 3)]
+_ARRAYN_SHAPES = [(), (-1), (1, -1)]
+# Mandatory kwargs of `validate_array3`, keyed by `(reshape, broadcast)`
+_ARRAY3_KWARGS = {
+    (False, False): {'must_have_shape': [(3,)]},
+    (True, False): {'reshape_to': (-1), 'must_have_shape': [(3,), (1, 3), (3, 1)]},
+    # allow 0D scalars and 1D 1-element vectors when broadcasting
+    (False, True): {'broadcast_to': (3,), 'must_have_shape': [(3,), (), (1,)]},
+    (True, True): {
+        'reshape_to': (-1),
+        'broadcast_to': (3,),
+        'must_have_shape': [(3,), (1, 3), (3, 1), (), (1,)],
+    },
+}
+
+# Mandatory kwargs of `validate_arrayN_uintlike` and `validate_data_range`
+_ARRAYN_UINTLIKE_KWARGS = {'must_be_integer': True, 'must_be_nonnegative': True}
+_DATA_RANGE_KWARGS = {'must_have_shape': 2, 'must_be_sorted': True}
+
+# Range of Python ints which NumPy can cast without creating an object array
+_INT_MIN = np.iinfo(np.int64).min
+_INT_MAX = np.iinfo(np.uint64).max
+
+
 def validate_array(
     arr,
     /,
@@ -286,11 +313,36 @@ def validate_array(
         check_shape(arr_out, must_have_shape, name=name)
 
     # Do reshape _after_ checking shape to prevent unexpected reshaping
-    if reshape_to is not None and arr_out.shape != reshape_to:
-        arr_out = arr_out.reshape(reshape_to)
+    if reshape_to is not None:
+        if not isinstance(reshape_to, tuple):
+            reshape_to = (reshape_to,)
+        # Flattening an array which is already 1D has no effect
+        if arr_out.shape != reshape_to and not (reshape_to == (-1,) and arr_out.ndim == 1):
+            arr_out = arr_out.reshape(reshape_to)
+
+    # Check data values _before_ broadcasting since broadcasting only
+    # repeats values, skipping all checks if none are requested
+    if must_be_nonnegative or must_be_finite or must_be_integer or must_be_in_range is not None:
+        if must_be_nonnegative:
+            check_nonnegative(arr_out, name=name)
+        if must_be_finite:
+            check_finite(arr_out, name=name)
+        if must_be_integer:
+            check_integer(arr_out, strict=False, name=name)
+        if must_be_in_range is not None:
+            check_range(
+                arr_out,
+                must_be_in_range,
+                strict_lower=strict_lower_bound,
+                strict_upper=strict_upper_bound,
+                name=name,
+            )
 
-    if broadcast_to is not None and arr_out.shape != broadcast_to:
-        arr_out = np.broadcast_to(arr_out, broadcast_to, subok=True)
+    if broadcast_to is not None:
+        if not isinstance(broadcast_to, tuple):
+            broadcast_to = (broadcast_to,)
+        if arr_out.shape != broadcast_to:
+            arr_out = np.broadcast_to(arr_out, broadcast_to, subok=True)
 
     # Check length _after_ reshaping otherwise length may be wrong
     if (
@@ -299,7 +351,7 @@ def validate_array(
         or must_have_max_length is not None
     ):
         check_length(
-            arr,
+            arr_out,
             exact_length=must_have_length,
             min_length=must_have_min_length,
             max_length=must_have_max_length,
@@ -307,21 +359,7 @@ def validate_array(
             name=name,
         )
 
-    # Check data values
-    if must_be_nonnegative:
-        check_nonnegative(arr_out, name=name)
-    if must_be_finite:
-        check_finite(arr_out, name=name)
-    if must_be_integer:
-        check_integer(arr_out, strict=False, name=name)
-    if must_be_in_range is not None:
-        check_range(
-            arr_out,
-            must_be_in_range,
-            strict_lower=strict_lower_bound,
-            strict_upper=strict_upper_bound,
-            name=name,
-        )
+    # Check sorting _after_ broadcasting since it depends on the shape
     if must_be_sorted:
         if isinstance(must_be_sorted, dict):
             check_sorted(arr_out, **must_be_sorted, name=name)
@@ -426,40 +464,51 @@ def validate_axes(
     if len(axes) == 1:
         axes_array = validate_array(axes[0], must_have_shape=(3, 3), name=name)
     else:
-        axes_array = np.zeros((3, 3))
-        axes_array[0] = validate_array3(axes[0], name=f"{name} Vector[0]")
-        axes_array[1] = validate_array3(axes[1], name=f"{name} Vector[1]")
-        if len(axes) == 3:
-            axes_array[2] = validate_array3(axes[2], name=f"{name} Vector[2]")
-        else:  # len(axes) == 2
+        num_vectors = len(axes)
+        axes_array = np.empty((3, 3))
+        try:
+            # Validate all vectors at once if they can be stacked
+            axes_array[:num_vectors] = validate_array(
+                axes,
+                must_have_shape=(num_vectors, 3),
+                name=name,
+            )
+        except (TypeError, ValueError):
+            # Validate each vector separately to report which one is invalid
+            for i in range(num_vectors):
+                axes_array[i] = validate_array3(axes[i], name=f"{name} Vector[{i}]")
+        if num_vectors == 2:
             if must_have_orientation == 'right':
                 axes_array[2] = np.cross(axes_array[0], axes_array[1])
             else:
                 axes_array[2] = np.cross(axes_array[1], axes_array[0])
     check_finite(axes_array, name=name)
 
-    if np.isclose(np.dot(axes_array[0], axes_array[1]), 1) or np.isclose(
-        np.dot(axes_array[0], axes_array[2]),
-        1,
-    ):
+    # Compare the first axis with the other two at once
+    if np.any(np.isclose(axes_array[1:] @ axes_array[0], 1)):
         raise ValueError(f"{name} cannot be parallel.")
-    if np.any(np.all(np.isclose(axes_array, np.zeros(3)), axis=1)):
+    # Same as `np.isclose(axes_array, 0)`, the values are known to be finite
+    if np.any(np.all(np.abs(axes_array) <= 1e-8, axis=1)):
         raise ValueError(f"{name} cannot be zeros.")
 
     # Check orthogonality and orientation using cross products
     # Normalize axes first since norm values are needed for cross product calc
-    axes_norm = axes_array / np.linalg.norm(axes_array, axis=1).reshape((3, 1))
-    cross_0_1 = np.cross(axes_norm[0], axes_norm[1])
-    cross_1_2 = np.cross(axes_norm[1], axes_norm[2])
-
-    if must_be_orthogonal and not (
-        (np.allclose(cross_0_1, axes_norm[2]) or np.allclose(cross_0_1, -axes_norm[2]))
-        and (np.allclose(cross_1_2, axes_norm[0]) or np.allclose(cross_1_2, -axes_norm[0]))
-    ):
-        raise ValueError(f"{name} are not orthogonal.")
+    norms = np.sqrt(np.einsum('ij,ij->i', axes_array, axes_array))
+    axes_norm = axes_array / norms[:, np.newaxis]
+    # Compute the cross products of axes 0 and 1, and of axes 1 and 2 at once
+    crosses = np.cross(axes_norm[:2], axes_norm[1:])
+
+    if must_be_orthogonal:
+        # Each cross product must be close to the remaining axis (or its negative).
+        # Same as `np.allclose` per cross product, the values are known to be finite
+        others = axes_norm[[2, 0]]
+        is_close = np.all(np.isclose(crosses, others), axis=1)
+        is_close_negative = np.all(np.isclose(crosses, -others), axis=1)
+        if not np.all(is_close | is_close_negative):
+            raise ValueError(f"{name} are not orthogonal.")
 
     if must_have_orientation:
-        dot = np.dot(cross_0_1, axes_norm[2])
+        dot = crosses[0] @ axes_norm[2]
         if must_have_orientation == 'right' and dot < 0:
             raise ValueError(f"{name} do not have a right-handed orientation.")
         if must_have_orientation == 'left' and dot > 0:
@@ -498,10 +547,10 @@ def validate_transform4x4(transform, /, *, name="Transform"):
 
     """
     check_string(name, name="Name")
-    arr = np.eye(4)  # initialize
     if isinstance(transform, vtkMatrix4x4):
         arr = _array_from_vtkmatrix(transform, shape=(4, 4))
     elif isinstance(transform, vtkMatrix3x3):
+        arr = np.eye(4)
         arr[:3, :3] = _array_from_vtkmatrix(transform, shape=(3, 3))
     elif isinstance(transform, vtkTransform):
         arr = _array_from_vtkmatrix(transform.GetMatrix(), shape=(4, 4))
@@ -513,10 +562,6 @@ def validate_transform4x4(transform, /, *, name="Transform"):
                 must_be_finite=True,
                 name=name,
             )
-            if valid_arr.shape == (3, 3):
-                arr[:3, :3] = valid_arr
-            else:
-                arr = valid_arr
         except ValueError:
             raise TypeError(
                 'Input transform must be one of:\n'
@@ -526,6 +571,12 @@ def validate_transform4x4(transform, /, *, name="Transform"):
                 '\t4x4 np.ndarray\n'
                 '\t3x3 np.ndarray\n',
             )
+        if valid_arr.shape == (3, 3):
+            # Only allocate the identity matrix when it needs to be filled
+            arr = np.eye(4)
+            arr[:3, :3] = valid_arr
+        else:
+            arr = valid_arr
 
     return arr
 
@@ -557,9 +608,8 @@ def validate_transform3x3(transform, /, *, name="Transform"):
 
     """
     check_string(name, name="Name")
-    arr = np.eye(3)  # initialize
     if isinstance(transform, vtkMatrix3x3):
-        arr[:3, :3] = _array_from_vtkmatrix(transform, shape=(3, 3))
+        arr = _array_from_vtkmatrix(transform, shape=(3, 3))
     else:
         try:
             arr = validate_array(transform, must_have_shape=(3, 3), name=name)
@@ -573,10 +623,11 @@ def _array_from_vtkmatrix(
     shape: Union[Tuple[Literal[3], Literal[3]], Tuple[Literal[4], Literal[4]]],
 ) -> NumpyArray[float]:
     """Convert a vtk matrix to an array."""
-    array = np.zeros(shape)
-    for i, j in product(range(shape[0]), range(shape[1])):
-        array[i, j] = matrix.GetElement(i, j)
-    return array
+    # Build the array from nested lists in one call rather than setting each
+    # element of a numpy array separately
+    get_element = matrix.GetElement
+    rows, cols = range(shape[0]), range(shape[1])
+    return np.array([[get_element(i, j) for j in cols] for i in rows], dtype=float)
 
 
 def validate_number(num, /, *, reshape=True, **kwargs):
@@ -631,12 +682,21 @@ def validate_number(num, /, *, reshape=True, **kwargs):
     10
 
     """
+    if kwargs.keys() <= {'name'}:
+        # Fast path for plain Python numbers which avoids creating an array
+        value = num[0] if reshape and type(num) in (list, tuple) and len(num) == 1 else num
+        value_type = type(value)
+        if value_type is float and math.isfinite(value):
+            return value
+        if value_type is int and _INT_MIN <= value <= _INT_MAX:
+            return value
+
     kwargs.setdefault('name', 'Number')
     kwargs.setdefault('to_list', True)
     kwargs.setdefault('must_be_finite', True)
 
     if reshape:
-        shape = [(), (1,)]
+        shape = _NUMBER_SHAPES
         _set_default_kwarg_mandatory(kwargs, 'reshape_to', ())
     else:
         shape = ()
@@ -687,8 +747,7 @@ def validate_data_range(rng, /, **kwargs):
 
     """
     kwargs.setdefault('name', 'Data Range')
-    _set_default_kwarg_mandatory(kwargs, 'must_have_shape', 2)
-    _set_default_kwarg_mandatory(kwargs, 'must_be_sorted', True)
+    _set_default_kwargs_mandatory(kwargs, _DATA_RANGE_KWARGS)
     if 'to_list' not in kwargs:
         kwargs.setdefault('to_tuple', True)
     return validate_array(rng, **kwargs)
@@ -756,7 +815,7 @@ def validate_arrayNx3(arr, /, *, reshape=True, **kwargs):
 
     """
     if reshape:
-        shape = [3, (-1, 3)]
+        shape = _ARRAYNx3_SHAPES
         _set_default_kwarg_mandatory(kwargs, 'reshape_to', (-1, 3))
     else:
         shape = (-1, 3)
@@ -830,7 +889,7 @@ def validate_arrayN(arr, /, *, reshape=True, **kwargs):
 
     """
     if reshape:
-        shape = [(), (-1), (1, -1)]
+        shape = _ARRAYN_SHAPES
         _set_default_kwarg_mandatory(kwargs, 'reshape_to', (-1))
     else:
         shape = -1
@@ -915,12 +974,11 @@ def validate_arrayN_uintlike(arr, /, *, reshape=True, **kwargs):
     """
     # Set default dtype out but allow overriding as long as the dtype
     # is also integral
-    kwargs.setdefault('dtype_out', int)
-    if kwargs['dtype_out'] is not int:
-        check_subdtype(kwargs['dtype_out'], np.integer)
+    dtype_out = kwargs.setdefault('dtype_out', int)
+    if dtype_out is not int:
+        check_subdtype(dtype_out, np.integer)
 
-    _set_default_kwarg_mandatory(kwargs, 'must_be_integer', True)
-    _set_default_kwarg_mandatory(kwargs, 'must_be_nonnegative', True)
+    _set_default_kwargs_mandatory(kwargs, _ARRAYN_UINTLIKE_KWARGS)
 
     return validate_arrayN(arr, reshape=reshape, **kwargs)
 
@@ -994,28 +1052,36 @@ def validate_array3(arr, /, *, reshape=True, broadcast=False, **kwargs):
     array([1, 2, 3])
 
     """
-    shape = [(3,)]
-    if reshape:
-        shape.append((1, 3))
-        shape.append((3, 1))
-        _set_default_kwarg_mandatory(kwargs, 'reshape_to', (-1))
-    if broadcast:
-        shape.append(())  # allow 0D scalars
-        shape.append((1,))  # 1D 1-element vectors
-        _set_default_kwarg_mandatory(kwargs, 'broadcast_to', (3,))
-    _set_default_kwarg_mandatory(kwargs, 'must_have_shape', shape)
+    _set_default_kwargs_mandatory(kwargs, _ARRAY3_KWARGS[bool(reshape), bool(broadcast)])
 
     return validate_array(arr, **kwargs)
 
 
 def _set_default_kwarg_mandatory(kwargs: Dict[str, Any], key: str, default: Any):
     """Set a kwarg and raise ValueError if not set to its default value."""
-    val = kwargs.pop(key, default)
-    if val != default:
-        calling_fname = inspect.stack()[1].function
-        msg = (
-            f"Parameter '{key}' cannot be set for function `{calling_fname}`.\n"
-            f"Its value is automatically set to `{default}`."
-        )
-        raise ValueError(msg)
+    val = kwargs.get(key, default)
+    # Check identity first since the value is usually not set
+    if val is not default and val != default:
+        # Only inspect the calling frame when raising
+        raise _mandatory_kwarg_error(key, default, sys._getframe(1).f_code.co_name)
     kwargs[key] = default
+
+
+def _set_default_kwargs_mandatory(kwargs: Dict[str, Any], defaults: Dict[str, Any]):
+    """Set multiple kwargs and raise ValueError if any is not set to its default value."""
+    # Only compare values if any of the mandatory kwargs are set
+    if not kwargs.keys().isdisjoint(defaults):
+        for key, default in defaults.items():
+            val = kwargs.get(key, default)
+            if val is not default and val != default:
+                raise _mandatory_kwarg_error(key, default, sys._getframe(1).f_code.co_name)
+    kwargs.update(defaults)
+
+
+def _mandatory_kwarg_error(key: str, default: Any, calling_fname: str) -> ValueError:
+    """Return the error for a mandatory kwarg which is not set to its default value."""
+    msg = (
+        f"Parameter '{key}' cannot be set for function `{calling_fname}`.\n"
+        f"Its value is automatically set to `{default}`."
+    )
+    return ValueError(msg)
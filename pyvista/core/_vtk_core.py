@@ -175,6 +175,7 @@ from vtkmodules.vtkCommonDataModel import (
     vtkCell,
     vtkCellArray,
     vtkCellLocator,
+    vtkCellTypes,
     vtkColor3ub,
     vtkCompositeDataSet,
     vtkDataObject,
@@ -5,7 +5,6 @@ from __future__ import annotations
 from collections import UserDict
 import collections.abc
 import enum
-from itertools import product
 import json
 from typing import TYPE_CHECKING, Optional, Tuple, Union
 
@@ -647,10 +646,9 @@ def array_from_vtkmatrix(matrix) -> NumpyArray[float]:
             'Expected vtk.vtkMatrix3x3 or vtk.vtkMatrix4x4 input,'
             f' got {type(matrix).__name__} instead.',
         )
-    array = np.zeros(shape)
-    for i, j in product(range(shape[0]), range(shape[1])):
-        array[i, j] = matrix.GetElement(i, j)
-    return array
+    get_element = matrix.GetElement
+    rows, cols = range(shape[0]), range(shape[1])
+    return np.array([[get_element(i, j) for j in cols] for i in rows], dtype=float)
 
 
 def vtkmatrix_from_array(array):
@@ -676,9 +674,8 @@ def vtkmatrix_from_array(array):
         matrix = _vtk.vtkMatrix4x4()
     else:
         raise ValueError(f'Invalid shape {array.shape}, must be (3, 3) or (4, 4).')
-    m, n = array.shape
-    for i, j in product(range(m), range(n)):
-        matrix.SetElement(i, j, array[i, j])
+    # Set all elements at once from the flattened row-major array
+    matrix.DeepCopy(array.ravel().tolist())
     return matrix
 
 
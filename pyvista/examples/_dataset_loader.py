@@ -54,7 +54,10 @@ from typing import (
     runtime_checkable,
 )
 
+import numpy as np
+
 import pyvista as pv
+from pyvista.core import _vtk_core as _vtk
 from pyvista.core._typing_core import NumpyArray
 from pyvista.core.utilities.fileio import get_ext
 
@@ -207,7 +210,7 @@ class _DatasetLoader:
     @final
     def clear_dataset(self):
         """Clear the stored dataset object from memory."""
-        del self._dataset
+        self._dataset = None
 
     @property
     @final
@@ -261,19 +264,19 @@ class _DatasetLoader:
             # Get the underlying dataset for the texture
             if isinstance(data, pv.Texture):
                 data = cast(pv.ImageData, pv.wrap(data.GetInput()))
-            try:
-                if isinstance(data, pv.ExplicitStructuredGrid):
-                    # extract_cells_by_type does not support this datatype
-                    # so get cells manually
-                    cells = (c.type for c in data.cell)
-                    [cell_types.update({cell_type: None}) for cell_type in cells]
-                else:
-                    for cell_type in pv.CellType:
-                        extracted = data.extract_cells_by_type(cell_type)  # type: ignore[union-attr]
-                        if extracted.n_cells > 0:
-                            cell_types[cell_type] = None
-            except AttributeError:
+            if isinstance(data, pv.UnstructuredGrid):
+                unique_types = np.unique(data.celltypes).tolist()
+            elif isinstance(data, pv.DataSet):
+                # Let VTK collect the distinct cell types instead of iterating
+                # over the cells in Python
+                vtk_cell_types = _vtk.vtkCellTypes()
+                data.GetCellTypes(vtk_cell_types)
+                unique_types = [
+                    vtk_cell_types.GetCellType(i) for i in range(vtk_cell_types.GetNumberOfTypes())
+                ]
+            else:
                 continue
+            cell_types.update(dict.fromkeys(map(pv.CellType, unique_types)))
         return tuple(sorted(cell_types.keys()))
 
 
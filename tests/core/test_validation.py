@@ -41,7 +41,11 @@ from pyvista.core._validation import (
 )
 from pyvista.core._validation._cast_array import _cast_to_list, _cast_to_numpy, _cast_to_tuple
 from pyvista.core._validation.check import _validate_shape_value
-from pyvista.core._validation.validate import _array_from_vtkmatrix, _set_default_kwarg_mandatory
+from pyvista.core._validation.validate import (
+    _array_from_vtkmatrix,
+    _set_default_kwarg_mandatory,
+    _set_default_kwargs_mandatory,
+)
 from pyvista.core._vtk_core import vtkMatrix3x3, vtkMatrix4x4
 from pyvista.core.utilities.arrays import array_from_vtkmatrix, vtkmatrix_from_array
 
@@ -188,6 +192,24 @@ def test_set_default_kwarg_mandatory():
         _set_default_kwarg_mandatory(kwargs, default_key, default_value)
 
 
+def test_set_default_kwargs_mandatory():
+    defaults = dict(j=0, k=1)
+
+    # Test parameters unset or already set to default
+    kwargs = dict(k=1, other=2)
+    _set_default_kwargs_mandatory(kwargs, defaults)
+    assert kwargs == dict(j=0, k=1, other=2)
+
+    # Test parameter set to non-default
+    kwargs = dict(k=2)
+    msg = (
+        "Parameter 'k' cannot be set for function `test_set_default_kwargs_mandatory`.\n"
+        "Its value is automatically set to `1`."
+    )
+    with pytest.raises(ValueError, match=msg):
+        _set_default_kwargs_mandatory(kwargs, defaults)
+
+
 def test_check_shape():
     check_shape(0, ())
     check_shape(0, [(), 2])
@@ -526,6 +548,34 @@ def test_validate_array(
         assert array_out is not array_in
 
 
+def test_validate_array_length_after_reshape():
+    # length is checked using the reshaped array, not the input
+    arr = validate_array([[1, 2, 3]], reshape_to=(-1,), must_have_length=3)
+    assert arr.shape == (3,)
+    match = 'Array must have a length equal to any of: 1. Got length 3 instead.'
+    with pytest.raises(ValueError, match=escape(match)):
+        validate_array([[1, 2, 3]], reshape_to=(-1,), must_have_length=1)
+
+    # scalar arrays are treated as having length 1
+    arr = validate_array(np.array(5.0), must_have_length=1)
+    assert arr.ndim == 0
+
+
+def test_validate_array_values_before_broadcast():
+    # values are checked before broadcasting
+    with pytest.raises(ValueError, match='must have finite values'):
+        validate_array(np.inf, broadcast_to=(3, 2), must_be_finite=True)
+    with pytest.raises(ValueError, match='must all be greater than or equal to 0'):
+        validate_array([[2], [-1]], broadcast_to=(2, 3), must_be_in_range=[0, 3])
+
+    arr = validate_array([[2], [1]], broadcast_to=(2, 3), must_be_in_range=[0, 3])
+    assert arr.shape == (2, 3)
+
+    # sorting is checked after broadcasting
+    with pytest.raises(ValueError, match='must be sorted'):
+        validate_array(0, broadcast_to=(3,), must_be_sorted=dict(strict=True))
+
+
 @pytest.mark.parametrize('obj', [0, 0.0, "0"])
 @pytest.mark.parametrize('classinfo', [int, (int, float), [int, float]])
 @pytest.mark.parametrize('allow_subclass', [True, False])
@@ -930,6 +980,28 @@ def test_validate_axes_orthogonal(bias_index):
         validate_axes(axes_left, must_be_orthogonal=True)
 
 
+@pytest.mark.parametrize(
+    ('axes', 'is_orthogonal'),
+    [
+        ([[1, 1e-9, 0], [0, 1, 0], [0, 0, 1]], True),
+        ([[1, 1e-6, 0], [0, 1, 0], [0, 0, 1]], False),
+        ([[1, 0, 0], [0, 1, 0], [0, 1e-9, 1]], True),
+        ([[1, 0, 0], [0, 1, 0], [0, 1e-7, 1]], False),
+    ],
+)
+def test_validate_axes_orthogonal_tolerance(axes, is_orthogonal):
+    msg = "Axes are not orthogonal."
+    if is_orthogonal:
+        validate_axes(axes)
+        validate_axes(axes[0], axes[1], must_have_orientation='right')
+    else:
+        with pytest.raises(ValueError, match=msg):
+            validate_axes(axes)
+        # Orthogonality is checked before the orientation
+        with pytest.raises(ValueError, match=msg):
+            validate_axes(axes, must_have_orientation='left')
+
+
 @pytest.mark.parametrize('as_any', [True, False])
 @pytest.mark.parametrize('copy', [True, False])
 @pytest.mark.parametrize('dtype', [None, float])
@@ -1010,3 +1082,15 @@ def test_array_from_vtkmatrix(cls, shape):
     # Test this matches public function
     expected = array_from_vtkmatrix(mat)
     assert np.array_equal(actual, expected)
+
+
+def test_lazy_import():
+    from pyvista.core import _validation
+
+    assert sorted(_validation.__all__) == sorted(
+        name for name in dir(_validation) if name.startswith(('check_', 'validate_'))
+    )
+    assert _validation.check_type is check_type
+    assert _validation.validate_array is validate_array
+    with pytest.raises(AttributeError, match="has no attribute 'check_foo'"):
+        _validation.check_foo  # noqa: B018
@@ -0,0 +1,58 @@
+"""Tests for the dataset gallery cards generated by ``doc/source/make_tables.py``."""
+
+from pathlib import Path
+
+import pytest
+
+import pyvista as pv
+
+DOC_SOURCE_DIR = Path(__file__).parents[1] / 'doc' / 'source'
+
+
+@pytest.fixture()
+def make_tables(monkeypatch, tmp_path):
+    monkeypatch.syspath_prepend(str(DOC_SOURCE_DIR))
+    make_tables = pytest.importorskip('make_tables')
+
+    # The output paths are relative to the doc source directory
+    source_dir = tmp_path / 'source'
+    (source_dir / make_tables.DATASET_GALLERY_DIR).mkdir(parents=True)
+    (source_dir / make_tables.DATASET_GALLERY_DIR / 'not_available.png').touch()
+    monkeypatch.chdir(source_dir)
+
+    fetcher = make_tables.DatasetCardFetcher
+    for attr in ('DATASET_CARDS_OBJ', 'DATASET_CARDS_RST', 'DATASET_CARDS_RST_REF', 'DATASET_META'):
+        monkeypatch.setattr(fetcher, attr, {})
+    return make_tables
+
+
+@pytest.fixture()
+def ant_card(make_tables, monkeypatch):
+    loader = pv.examples.examples._dataset_ant
+    monkeypatch.setattr(loader, '_module', pv.examples.examples, raising=False)
+    loader.load_and_store_dataset()
+    card = make_tables.DatasetCard('ant', loader)
+    card.file_info, card.cell_type_names, card.files_mtime = card.get_loader_info()
+    make_tables.DatasetCardFetcher.DATASET_CARDS_OBJ['ant'] = card
+    yield card
+    loader.clear_dataset()
+
+
+def test_dataset_card_regenerated_if_source_url_changes(make_tables, ant_card, monkeypatch):
+    fetcher = make_tables.DatasetCardFetcher
+    generated = []
+    generate = ant_card.generate
+    monkeypatch.setattr(ant_card, 'generate', lambda: generated.append(True) or generate())
+
+    fetcher.generate_rst_all_cards()
+    assert len(generated) == 1
+    assert ant_card.loader.source_url_blob in fetcher.DATASET_CARDS_RST['ant']
+
+    # The cached rst is used if the card has not changed
+    fetcher.generate_rst_all_cards()
+    assert len(generated) == 1
+
+    monkeypatch.setattr(ant_card.loader, '_base_url', 'https://example.com/Data/')
+    fetcher.generate_rst_all_cards()
+    assert len(generated) == 2
+    assert 'https://example.com/Data/ant.ply' in fetcher.DATASET_CARDS_RST['ant']